@@ -6,19 +6,58 @@ It only handles HTTP concerns - all business logic is in other modules.
 """
 
 import os
+import json
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
 from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import FileResponse, JSONResponse, HTMLResponse
+from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from app.queue.job_queue import job_queue
 from app.queue.worker import background_worker
+from app.database import JobStatus
 
 logger = logging.getLogger(__name__)
 
+# How often /jobs/{job_id}/events checks the job, and how long it stays
+# silent before sending a keep-alive comment
+STATUS_EVENT_POLL_SECONDS = 0.5
+STATUS_EVENT_KEEPALIVE_SECONDS = 15.0
+
+
+def _job_status_response(job_id: str, job: dict) -> dict:
+    """
+    Build the status payload shared by /jobs/{job_id}/status and /events.
+    
+    Args:
+        job_id: Job ID
+        job: Job record from the queue
+        
+    Returns:
+        Job status information
+    """
+    response = {
+        "job_id": job_id,
+        "status": job['status'],
+        "created_at": job['created_at'],
+        "updated_at": job['updated_at'],
+        "original_filename": job['original_filename']
+    }
+    
+    # Add error message if failed
+    if job.get('error_message'):
+        response['error_message'] = job['error_message']
+    
+    # Add download URL if completed
+    if job['status'] == 'completed' and job.get('result_zip_path'):
+        response['download_url'] = f"/jobs/{job_id}/download"
+        response['metadata_url'] = f"/jobs/{job_id}/metadata"
+    
+    return response
+
 
 def create_app() -> FastAPI:
     """
@@ -187,24 +226,54 @@ def _register_routes(app: FastAPI):
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
-        response = {
-            "job_id": job_id,
-            "status": job['status'],
-            "created_at": job['created_at'],
-            "updated_at": job['updated_at'],
-            "original_filename": job['original_filename']
-        }
+        return _job_status_response(job_id, job)
+    
+    @app.get("/jobs/{job_id}/events")
+    async def stream_job_status(job_id: str):
+        """
+        Stream status changes of a transcription job as Server-Sent Events.
         
-        # Add error message if failed
-        if job.get('error_message'):
-            response['error_message'] = job['error_message']
+        Each change is sent as an ``event: status`` message whose data is the
+        same JSON as ``/jobs/{job_id}/status``; the stream ends once the job
+        is completed or failed.
         
-        # Add download URL if completed
-        if job['status'] == 'completed' and job.get('result_zip_path'):
-            response['download_url'] = f"/jobs/{job_id}/download"
-            response['metadata_url'] = f"/jobs/{job_id}/metadata"
+        Args:
+            job_id: Job ID
+            
+        Returns:
+            text/event-stream response
+        """
+        if not job_queue.get_job(job_id):
+            raise HTTPException(status_code=404, detail="Job not found")
         
-        return response
+        async def status_events():
+            last_status = None
+            idle_seconds = 0.0
+            while True:
+                job = job_queue.get_job(job_id)
+                if not job:
+                    return
+                
+                if job['status'] != last_status:
+                    last_status = job['status']
+                    idle_seconds = 0.0
+                    payload = json.dumps(_job_status_response(job_id, job))
+                    yield f"event: status\ndata: {payload}\n\n"
+                    if last_status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                        return
+                elif idle_seconds >= STATUS_EVENT_KEEPALIVE_SECONDS:
+                    # Comment line so clients and proxies don't time out a long job
+                    idle_seconds = 0.0
+                    yield ": keep-alive\n\n"
+                
+                await asyncio.sleep(STATUS_EVENT_POLL_SECONDS)
+                idle_seconds += STATUS_EVENT_POLL_SECONDS
+        
+        return StreamingResponse(
+            status_events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
     
     @app.get("/jobs/{job_id}/metadata")
     async def get_job_metadata(job_id: str):
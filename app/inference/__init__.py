@@ -6,6 +6,10 @@ This module contains all inference-related services:
 - Additional models for the new algorithm
 """
 
-from app.inference.transcription import TranscriptionService, transcription_service
+from app.inference.transcription import (
+    TranscriptionService,
+    get_transcription_service,
+    transcription_service
+)
 
-__all__ = ['TranscriptionService', 'transcription_service']
+__all__ = ['TranscriptionService', 'get_transcription_service', 'transcription_service']
@@ -5,8 +5,13 @@ This module provides model initialization and management.
 The actual transcription is handled by the pipeline module.
 """
 
+import os
+import hashlib
+import threading
 import torch
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from transformers import WhisperProcessor, WhisperForConditionalGeneration, GenerationConfig
 import logging
@@ -44,10 +49,45 @@ class TranscriptionService:
     MIN_OVERLAP_SECONDS = 10  # Minimum overlap between chunks in sliding window approach
     SIMILARITY_THRESHOLD = 0.80  # Threshold for detecting overlapping text
     
+    # Number of chunks stacked into a single generate() call
+    BATCH_SIZE = 8
+    
+    # Decoding settings: the model is Arabic-only, so skip language detection;
+    # greedy decoding with KV cache. 300 new tokens leaves headroom for fast
+    # (hadr) recitation of a full 30s window while cutting off runaway loops.
+    GENERATION_LANGUAGE = "ar"
+    MAX_NEW_TOKENS = 300
+    
+    # Shorter chunks get a proportionally smaller cap (generous for Arabic BPE
+    # plus timestamp tokens), so a hallucination loop stops early
+    TOKENS_PER_SECOND = 12
+    MIN_NEW_TOKENS_CAP = 32
+    
+    # Concurrent mini-batches on CPU (torch kernels release the GIL)
+    CPU_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+    
+    # Compile the Whisper encoder and decoder forward on CUDA (fixed shapes, CUDA graphs)
+    COMPILE_MODEL = True
+    
+    # Results kept for repeated chunks (same recitation uploaded again); 0 disables
+    RESULT_CACHE_SIZE = 1024
+    
+    # Chunks whose peak amplitude stays below this (-60 dBFS) are treated as
+    # silence and never reach the model
+    SILENCE_PEAK_THRESHOLD = 1e-3
+    
     def __init__(self):
         self.model = None
         self.processor = None
+        self.feature_extractor = None
         self.device = None
+        self.copy_stream = None
+        self.mel_filters = None
+        self.stft_window = None
+        self.fw_model = None
+        self.quantized = False
+        self.compiled = False
+        self.result_cache = OrderedDict()
         self._initialize_model()
     
     def _initialize_model(self):
@@ -61,16 +101,207 @@ class TranscriptionService:
             
             # Load processor and model
             self.processor = WhisperProcessor.from_pretrained(self.MODEL_NAME)
-            self.model = WhisperForConditionalGeneration.from_pretrained(self.MODEL_NAME)
-            generation_config = GenerationConfig.from_pretrained(self.BASE_MODEL_NAME)
-            self.model.generation_config = generation_config
-            self.model.to(self.device)
+            self.feature_extractor = self.processor.feature_extractor
+            
+            if os.getenv('TRANSCRIPTION_BACKEND', 'transformers').lower() == 'faster_whisper':
+                self._initialize_faster_whisper()
+            
+            # The Transformers model is only needed when faster-whisper isn't serving requests
+            if self.fw_model is None:
+                self._load_transformers_model()
             
             logger.info("Model loaded successfully")
         except Exception as e:
             logger.error(f"Error loading model: {e}")
             raise
     
+    def _load_transformers_model(self):
+        """Load the Transformers Whisper model and its GPU helpers."""
+        # Loading straight into the target dtype with low_cpu_mem_usage skips the random
+        # init + fp32 copy (safetensors checkpoints are memory-mapped when available).
+        model_dtype = self._get_model_dtype()
+        logger.info(f"Using dtype: {model_dtype}")
+        
+        if self.device == "cuda" and os.getenv('TRANSCRIPTION_INT8', 'false').lower() in ('true', '1', 'yes'):
+            self.model = self._load_int8_model(model_dtype)
+        
+        if self.model is None:
+            self.model = WhisperForConditionalGeneration.from_pretrained(
+                self.MODEL_NAME,
+                torch_dtype=model_dtype,
+                low_cpu_mem_usage=True
+            )
+            self.model.to(self.device)
+        
+        generation_config = GenerationConfig.from_pretrained(self.BASE_MODEL_NAME)
+        self.model.generation_config = generation_config
+        
+        if self.device == "cuda":
+            # Side stream so host-to-device copies overlap with generate()
+            self.copy_stream = torch.cuda.Stream()
+            # Log-mel is computed on the GPU; keep Whisper's filterbank and window there
+            self.mel_filters = torch.from_numpy(
+                np.asarray(self.feature_extractor.mel_filters, dtype=np.float32)
+            ).to(self.device)
+            self.stft_window = torch.hann_window(self.feature_extractor.n_fft, device=self.device)
+        
+        # Inference only: disable dropout once here
+        self.model.eval()
+        
+        # bitsandbytes int8 kernels don't trace under torch.compile
+        if self.device == "cuda" and self.COMPILE_MODEL and not self.quantized:
+            self._compile_model()
+    
+    def _get_model_dtype(self) -> torch.dtype:
+        """
+        Pick the Whisper weight dtype for the current device.
+        
+        Whisper-base is numerically fine in half precision on GPU and it halves
+        weight and activation bandwidth. fp16 is the default; TRANSCRIPTION_DTYPE
+        can select bfloat16 (Ampere+) or float32. CPU always uses float32.
+        
+        Returns:
+            torch dtype for the model weights
+        """
+        if self.device != "cuda":
+            return torch.float32
+        
+        dtype_name = os.getenv('TRANSCRIPTION_DTYPE', 'float16').lower()
+        dtypes = {
+            'float16': torch.float16,
+            'bfloat16': torch.bfloat16,
+            'float32': torch.float32,
+        }
+        if dtype_name not in dtypes:
+            logger.warning(f"Unknown TRANSCRIPTION_DTYPE '{dtype_name}', using float16")
+            return torch.float16
+        
+        if dtype_name == 'bfloat16' and not torch.cuda.is_bf16_supported():
+            logger.warning("bfloat16 not supported on this GPU, using float16")
+            return torch.float16
+        
+        return dtypes[dtype_name]
+    
+    def _load_int8_model(self, model_dtype: torch.dtype):
+        """
+        Load Whisper with bitsandbytes int8 weight-only quantization (CUDA only).
+        
+        Linear weights are stored in int8 (~2x smaller than fp16), the rest of
+        the model stays in model_dtype. This mainly reduces VRAM so more jobs
+        fit per GPU; for raw int8 speed use the faster-whisper backend.
+        
+        Args:
+            model_dtype: dtype for the non-quantized modules
+        
+        Returns:
+            Quantized model already placed on the GPU, or None if bitsandbytes is unavailable
+        """
+        try:
+            from transformers import BitsAndBytesConfig
+            import bitsandbytes  # noqa: F401
+        except ImportError:
+            logger.warning("TRANSCRIPTION_INT8 set but bitsandbytes is not installed, loading unquantized model")
+            return None
+        
+        logger.info("Loading Whisper with int8 weight-only quantization (bitsandbytes)")
+        model = WhisperForConditionalGeneration.from_pretrained(
+            self.MODEL_NAME,
+            torch_dtype=model_dtype,
+            quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+            device_map={"": self.device}
+        )
+        self.quantized = True
+        return model
+    
+    def _initialize_faster_whisper(self):
+        """
+        Load the optional faster-whisper (CTranslate2) backend.
+        
+        Requires the faster-whisper package and a CTranslate2 conversion of
+        MODEL_NAME (FASTER_WHISPER_MODEL), e.g. produced with:
+        ct2-transformers-converter --model tarteel-ai/whisper-base-ar-quran --output_dir <dir>
+        
+        When this backend loads, the Transformers model is not loaded at all.
+        """
+        model_path = os.getenv('FASTER_WHISPER_MODEL')
+        if not model_path:
+            logger.warning("TRANSCRIPTION_BACKEND=faster_whisper but FASTER_WHISPER_MODEL is not set, using transformers")
+            return
+        
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            logger.warning("faster-whisper not installed, using transformers backend")
+            return
+        
+        default_compute_type = "int8_float16" if self.device == "cuda" else "int8"
+        compute_type = os.getenv('FASTER_WHISPER_COMPUTE_TYPE', default_compute_type)
+        
+        logger.info(f"Loading faster-whisper model: {model_path} (compute_type={compute_type})")
+        self.fw_model = WhisperModel(model_path, device=self.device, compute_type=compute_type)
+    
+    def _transcribe_with_faster_whisper(self, audio_arrays: list) -> list:
+        """
+        Transcribe audio chunks (each <= 30 seconds) with the faster-whisper backend.
+        
+        Args:
+            audio_arrays: List of numpy arrays of audio samples (float32, 16kHz)
+        
+        Returns:
+            List of transcription result dictionaries with 'text' key, in input order
+        """
+        results = []
+        for audio_array in audio_arrays:
+            segments, _ = self.fw_model.transcribe(
+                np.asarray(audio_array, dtype=np.float32),
+                language="ar",
+                beam_size=1,
+                condition_on_previous_text=False,
+                vad_filter=False
+            )
+            results.append({
+                'text': ''.join(segment.text for segment in segments).strip(),
+                'predicted_ids': None
+            })
+        return results
+    
+    def _compile_model(self):
+        """
+        Compile the Whisper encoder and decoder forward with torch.compile and warm them up.
+        
+        The encoder input is always padded to the same 30 second window. The
+        decoder runs through model.forward on every generation step, so it is
+        compiled with a static KV cache to keep its shapes fixed (otherwise
+        the growing cache forces recompiles). Warm-up pays the compilation
+        cost at startup instead of on the first request; on any failure the
+        eager model is restored.
+        """
+        encoder = self.model.model.encoder
+        forward = self.model.forward
+        cache_implementation = self.model.generation_config.cache_implementation
+        try:
+            logger.info("Compiling Whisper model (torch.compile, reduce-overhead, static cache)")
+            self.model.model.encoder = torch.compile(
+                encoder, mode="reduce-overhead", fullgraph=False
+            )
+            self.model.generation_config.cache_implementation = "static"
+            self.model.forward = torch.compile(
+                forward, mode="reduce-overhead", fullgraph=False
+            )
+            
+            # Warm up the single-chunk and full-batch shapes
+            silence = np.zeros(int(self.MAX_AUDIO_LENGTH_SECONDS * self.SAMPLE_RATE), dtype=np.float32)
+            for batch_size in sorted({1, self.BATCH_SIZE}):
+                self._transcribe_chunk_batch([silence] * batch_size)
+            
+            self.compiled = True
+            logger.info("Whisper model compiled")
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, using eager model: {e}")
+            self.model.model.encoder = encoder
+            self.model.forward = forward
+            self.model.generation_config.cache_implementation = cache_implementation
+    
     def get_model_info(self):
         """
         Get information about the loaded model.
@@ -81,7 +312,9 @@ class TranscriptionService:
         return {
             "model_name": self.MODEL_NAME,
             "device": self.device,
-            "model_loaded": self.model is not None,
+            "backend": "faster_whisper" if self.fw_model is not None else "transformers",
+            "quantized": self.quantized,
+            "model_loaded": self.model is not None or self.fw_model is not None,
             "processor_loaded": self.processor is not None
         }
 
@@ -95,35 +328,355 @@ class TranscriptionService:
         Returns:
             Transcription result dictionary with 'text' key
         """
-        # Use processor to convert audio to input features (mel spectrograms)
-        # The processor expects audio at 16kHz sample rate
-        input_features = self.processor(
-            audio_array, 
-            sampling_rate=self.SAMPLE_RATE, 
-            return_tensors="pt"
-        ).input_features
+        result = self._transcribe_chunk_batch([audio_array])[0]
+
+        logger.info(f"Single Chunk Transcription: {result['text']}")
+        
+        return result
+    
+    def _prepare_input_features(self, audio_arrays: list):
+        """
+        Extract log-mel input features and start copying them to the model device.
         
-        # Move to device
-        input_features = input_features.to(self.device)
+        On CUDA the raw samples are staged in pinned memory, copied on a side
+        stream and turned into log-mel features on the GPU, so feature extraction
+        for the next batch overlaps with the current generate().
         
-        # Generate transcription with timestamps
-        predicted_ids = self.model.generate(
-            input_features,
-            return_timestamps=True
+        Args:
+            audio_arrays: List of numpy arrays of audio samples (float32, 16kHz)
+        
+        Returns:
+            Tuple of (input features tensor on the model device, copy-done CUDA event or None)
+        """
+        if self.copy_stream is None:
+            # Use the feature extractor to convert audio to input features (mel spectrograms)
+            # It expects audio at 16kHz sample rate
+            input_features = self.feature_extractor(
+                list(audio_arrays), 
+                sampling_rate=self.SAMPLE_RATE, 
+                return_tensors="pt"
+            ).input_features
+            return input_features.to(self.device, dtype=self.model.dtype), None
+        
+        # Pad raw samples to Whisper's 30 second window on the host, then copy
+        # them and compute the log-mel on the side stream
+        n_samples = self.feature_extractor.n_samples
+        waveforms = torch.zeros((len(audio_arrays), n_samples), dtype=torch.float32, pin_memory=True)
+        for i, audio_array in enumerate(audio_arrays):
+            audio_array = np.asarray(audio_array, dtype=np.float32)[:n_samples]
+            waveforms[i, :len(audio_array)] = torch.from_numpy(audio_array)
+        
+        copy_done = torch.cuda.Event()
+        with torch.cuda.stream(self.copy_stream):
+            device_waveforms = waveforms.to(self.device, non_blocking=True)
+            device_features = self._log_mel_spectrogram(device_waveforms).to(self.model.dtype)
+            copy_done.record(self.copy_stream)
+        return device_features, copy_done
+    
+    def _log_mel_spectrogram(self, waveforms: torch.Tensor) -> torch.Tensor:
+        """
+        Whisper log-mel features computed with torch ops on the waveform's device.
+        
+        Mirrors WhisperFeatureExtractor (same STFT, filterbank and per-input
+        max - 8 dB clamp), so the model sees the same inputs as on the CPU path.
+        
+        Args:
+            waveforms: (batch, n_samples) float32 tensor, already padded
+        
+        Returns:
+            (batch, n_mels, n_frames) float32 tensor
+        """
+        stft = torch.stft(
+            waveforms,
+            self.feature_extractor.n_fft,
+            self.feature_extractor.hop_length,
+            window=self.stft_window,
+            return_complex=True
         )
+        magnitudes = stft[..., :-1].abs() ** 2
+        mel_spec = self.mel_filters.T @ magnitudes
+        
+        log_spec = torch.clamp(mel_spec, min=1e-10).log10()
+        max_val = log_spec.amax(dim=(1, 2), keepdim=True)
+        log_spec = torch.maximum(log_spec, max_val - 8.0)
+        return (log_spec + 4.0) / 4.0
+    
+    def _max_new_tokens_for(self, audio_arrays: list) -> int:
+        """
+        Decoder token budget for a batch, proportional to its longest chunk.
+        
+        The compiled model uses a static KV cache sized by max_new_tokens, so it
+        always gets the fixed MAX_NEW_TOKENS to avoid re-capturing CUDA graphs.
+        
+        Args:
+            audio_arrays: List of numpy arrays of audio samples (float32, 16kHz)
+        
+        Returns:
+            max_new_tokens for generate()
+        """
+        if self.compiled or not audio_arrays:
+            return self.MAX_NEW_TOKENS
+        
+        longest_seconds = max(len(audio_array) for audio_array in audio_arrays) / self.SAMPLE_RATE
+        cap = int(longest_seconds * self.TOKENS_PER_SECOND) + self.MIN_NEW_TOKENS_CAP
+        return min(cap, self.MAX_NEW_TOKENS)
+    
+    def _generate_from_features(self, prepared_features: tuple, max_new_tokens: int = None) -> list:
+        """
+        Run Whisper generation on prepared input features and decode the result.
         
-        # Decode the transcription
-        transcription = self.processor.batch_decode(
-            predicted_ids, 
+        Args:
+            prepared_features: (input_features, copy_done) tuple from _prepare_input_features()
+            max_new_tokens: Decoder token budget (default: MAX_NEW_TOKENS)
+        
+        Returns:
+            List of transcription result dictionaries with 'text' key, in input order
+        """
+        input_features, copy_done = prepared_features
+        if copy_done is not None:
+            # Wait only for this batch's host-to-device copy, not later prefetches
+            torch.cuda.current_stream().wait_event(copy_done)
+            input_features.record_stream(torch.cuda.current_stream())
+        
+        # Generate transcription with timestamps
+        # inference_mode skips autograd and version-counter bookkeeping entirely
+        with torch.inference_mode():
+            predicted_ids = self.model.generate(
+                input_features,
+                return_timestamps=True,
+                language=self.GENERATION_LANGUAGE,
+                task="transcribe",
+                num_beams=1,
+                do_sample=False,
+                use_cache=True,
+                max_new_tokens=max_new_tokens or self.MAX_NEW_TOKENS
+            )
+        
+        # One device-to-host copy for the whole batch; decoding and the per-chunk
+        # predicted_ids slices then stay on the CPU instead of pinning GPU memory
+        predicted_ids = predicted_ids.cpu()
+        
+        # Decode the whole batch in one call; handing the tokenizer plain lists
+        # skips its per-sequence tensor-to-list conversion
+        transcription = self.processor.tokenizer.batch_decode(
+            predicted_ids.tolist(),
             skip_special_tokens=True
         )
-
-        logger.info(f"Single Chunk Transcription: {transcription[0]}")
         
-        return {
-            'text': transcription[0],
-            'predicted_ids': predicted_ids
-        }
+        return [
+            {
+                'text': text,
+                'predicted_ids': predicted_ids[i:i + 1]
+            }
+            for i, text in enumerate(transcription)
+        ]
+    
+    def _transcribe_chunk_batch(self, audio_arrays: list) -> list:
+        """
+        Transcribe several audio chunks (each <= 30 seconds) in one forward pass.
+        
+        The processor pads every chunk to Whisper's 30 second window, so the
+        stacked batch produces the same features as transcribing one by one.
+        
+        Args:
+            audio_arrays: List of numpy arrays of audio samples (float32, 16kHz)
+        
+        Returns:
+            List of transcription result dictionaries with 'text' key, in input order
+        """
+        if self.fw_model is not None:
+            return self._transcribe_with_faster_whisper(audio_arrays)
+        return self._generate_from_features(
+            self._prepare_input_features(audio_arrays),
+            self._max_new_tokens_for(audio_arrays)
+        )
+    
+    def transcribe_batch(self, audio_arrays: list, batch_size: int = None) -> list:
+        """
+        Transcribe many audio chunks, batching those within Whisper's limit.
+        
+        Chunks longer than MAX_AUDIO_LENGTH_SECONDS go through transcribe_bytes()
+        so they keep the progressive splitting behaviour.
+        
+        Args:
+            audio_arrays: List of numpy arrays of audio samples (float32, 16kHz)
+            batch_size: Chunks per generate() call (default: BATCH_SIZE)
+        
+        Returns:
+            List of transcription result dictionaries with 'text' key, in input order
+        """
+        batch_size = max(1, batch_size or self.BATCH_SIZE)
+        results = [None] * len(audio_arrays)
+        batchable_indices = []
+        cache_keys = []
+        
+        for i, audio_array in enumerate(audio_arrays):
+            if not isinstance(audio_array, np.ndarray):
+                audio_array = np.array(audio_array)
+            
+            if self._is_silent(audio_array):
+                cache_keys.append(None)
+                results[i] = {'text': '', 'predicted_ids': None}
+                continue
+            
+            cache_key = self._result_cache_key(audio_array) if self.RESULT_CACHE_SIZE > 0 else None
+            cache_keys.append(cache_key)
+            if cache_key in self.result_cache:
+                self.result_cache.move_to_end(cache_key)
+                results[i] = self.result_cache[cache_key]
+            elif len(audio_array) / self.SAMPLE_RATE <= self.MAX_AUDIO_LENGTH_SECONDS:
+                batchable_indices.append(i)
+            else:
+                results[i] = self.transcribe_bytes(audio_array)
+        
+        # Group chunks of similar duration: the encoder always sees a padded 30s
+        # window, but a batch decodes until its longest transcript finishes and its
+        # token budget follows the longest chunk. Results are written back by index.
+        batchable_indices.sort(key=lambda i: len(audio_arrays[i]))
+        
+        batches = [
+            batchable_indices[batch_start:batch_start + batch_size]
+            for batch_start in range(0, len(batchable_indices), batch_size)
+        ]
+        self._transcribe_batches(audio_arrays, batches, results)
+        
+        if self.RESULT_CACHE_SIZE > 0:
+            for cache_key, result in zip(cache_keys, results):
+                if cache_key is None:
+                    continue
+                self.result_cache[cache_key] = result
+                self.result_cache.move_to_end(cache_key)
+            while len(self.result_cache) > self.RESULT_CACHE_SIZE:
+                self.result_cache.popitem(last=False)
+        
+        return results
+    
+    def _is_silent(self, audio_array: np.ndarray) -> bool:
+        """
+        Check whether a chunk is effectively silence (peak below SILENCE_PEAK_THRESHOLD).
+        
+        Args:
+            audio_array: Numpy array of audio samples (float32, 16kHz)
+        
+        Returns:
+            True if the chunk is empty or silent
+        """
+        return len(audio_array) == 0 or float(np.max(np.abs(audio_array))) < self.SILENCE_PEAK_THRESHOLD
+    
+    def _result_cache_key(self, audio_array: np.ndarray) -> bytes:
+        """
+        Content hash of a chunk's samples, used to reuse earlier transcriptions.
+        
+        Args:
+            audio_array: Numpy array of audio samples
+        
+        Returns:
+            Digest identifying the waveform (dtype and length included)
+        """
+        audio_array = np.ascontiguousarray(audio_array)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(audio_array.dtype.str.encode())
+        digest.update(audio_array.data)
+        return digest.digest()
+    
+    def _transcribe_batches(self, audio_arrays: list, batches: list, results: list):
+        """
+        Transcribe mini-batches of chunks that are already within Whisper's limit.
+        
+        Args:
+            audio_arrays: List of numpy arrays of audio samples (float32, 16kHz)
+            batches: List of index lists into audio_arrays
+            results: Output list, filled in place at the batch indices
+        """
+        if self.fw_model is not None:
+            # CTranslate2 manages its own threads and device transfers
+            for batch_indices in batches:
+                batch_results = self._transcribe_chunk_batch([audio_arrays[i] for i in batch_indices])
+                for i, result in zip(batch_indices, batch_results):
+                    results[i] = result
+            return
+        
+        if self.device == "cpu" and len(batches) > 1 and self.CPU_WORKERS > 1:
+            self._transcribe_batches_threaded(audio_arrays, batches, results)
+            return
+        
+        try:
+            # Producer/consumer: a background thread extracts (and on CUDA copies)
+            # the features for batch N+1 while this thread runs generate() on batch N
+            with ThreadPoolExecutor(max_workers=1) as feature_pool:
+                pending_features = None
+                if batches:
+                    pending_features = feature_pool.submit(
+                        self._prepare_input_features,
+                        [audio_arrays[i] for i in batches[0]]
+                    )
+                
+                for batch_num, batch_indices in enumerate(batches):
+                    logger.info(
+                        f"Transcribing batch {batch_num + 1}/{len(batches)} "
+                        f"({len(batch_indices)} chunks)..."
+                    )
+                    
+                    prepared_features = pending_features.result()
+                    if batch_num + 1 < len(batches):
+                        pending_features = feature_pool.submit(
+                            self._prepare_input_features,
+                            [audio_arrays[i] for i in batches[batch_num + 1]]
+                        )
+                    
+                    batch_results = self._generate_from_features(
+                        prepared_features,
+                        self._max_new_tokens_for([audio_arrays[i] for i in batch_indices])
+                    )
+                    for i, result in zip(batch_indices, batch_results):
+                        results[i] = result
+        except Exception as e:
+            logger.error(f"Error transcribing batch: {e}")
+            raise
+    
+    def _transcribe_batches_threaded(self, audio_arrays: list, batches: list, results: list):
+        """
+        Transcribe mini-batches concurrently on CPU with a bounded thread pool.
+        
+        Intra-op threads are split between the workers so they don't
+        oversubscribe the cores, and restored afterwards.
+        
+        Args:
+            audio_arrays: List of numpy arrays of audio samples (float32, 16kHz)
+            batches: List of index lists into audio_arrays
+            results: Output list, filled in place at the batch indices
+        """
+        num_workers = min(self.CPU_WORKERS, len(batches))
+        original_num_threads = torch.get_num_threads()
+        threads_per_worker = max(1, original_num_threads // num_workers)
+        
+        logger.info(
+            f"Transcribing {len(batches)} batches on CPU with {num_workers} workers "
+            f"({threads_per_worker} threads each)..."
+        )
+        
+        try:
+            with ThreadPoolExecutor(
+                max_workers=num_workers,
+                initializer=torch.set_num_threads,
+                initargs=(threads_per_worker,)
+            ) as executor:
+                batch_results = executor.map(
+                    lambda batch_indices: self._transcribe_chunk_batch(
+                        [audio_arrays[i] for i in batch_indices]
+                    ),
+                    batches
+                )
+                
+                # map() yields in submission order, so indices line up with batches
+                for batch_indices, batch_result in zip(batches, batch_results):
+                    for i, result in zip(batch_indices, batch_result):
+                        results[i] = result
+        except Exception as e:
+            logger.error(f"Error transcribing batch: {e}")
+            raise
+        finally:
+            torch.set_num_threads(original_num_threads)
     
     def _split_on_silence(self, audio_array: np.ndarray) -> tuple:
         """
@@ -143,7 +696,9 @@ class TranscriptionService:
         max_samples = int(self.MAX_AUDIO_LENGTH_SECONDS * self.SAMPLE_RATE)
         
         # Convert numpy array to pydub AudioSegment
-        audio_int16 = (audio_array * 32767).astype(np.int16)
+        # Scale straight into the int16 buffer (no full-length float temporary)
+        audio_int16 = np.empty(len(audio_array), dtype=np.int16)
+        np.multiply(audio_array, 32767, out=audio_int16, casting='unsafe')
         audio_segment = AudioSegment(
             audio_int16.tobytes(),
             frame_rate=self.SAMPLE_RATE,
@@ -510,16 +1065,19 @@ class TranscriptionService:
             else:
                 logger.info(f"Split into {len(sub_chunks)} sub-chunks (approach: {self.FINAL_APPROACH})")
             
-            transcriptions = []
-            all_predicted_ids = []
-            
-            for i, sub_chunk in enumerate(sub_chunks):
-                sub_length = len(sub_chunk) / self.SAMPLE_RATE
-                logger.info(f"Transcribing sub-chunk {i+1}/{len(sub_chunks)} ({sub_length:.2f}s)...")
-                
-                result = self._transcribe_single_chunk(sub_chunk)
-                transcriptions.append(result['text'])
-                all_predicted_ids.append(result['predicted_ids'])
+            # Sub-chunks are all within the limit, so they go through the same
+            # batched path as regular chunks (prefetching on CUDA, worker pool on CPU)
+            sub_chunk_results = [None] * len(sub_chunks)
+            self._transcribe_batches(
+                sub_chunks,
+                [
+                    list(range(batch_start, min(batch_start + self.BATCH_SIZE, len(sub_chunks))))
+                    for batch_start in range(0, len(sub_chunks), self.BATCH_SIZE)
+                ],
+                sub_chunk_results
+            )
+            transcriptions = [result['text'] for result in sub_chunk_results]
+            all_predicted_ids = [result['predicted_ids'] for result in sub_chunk_results]
             
             # Combine transcriptions
             if self.FINAL_APPROACH == 'sliding_window' and len(transcriptions) > 1:
@@ -552,5 +1110,31 @@ class TranscriptionService:
 
 
 
-# Singleton instance
-transcription_service = TranscriptionService()
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_transcription_service() -> TranscriptionService:
+    """
+    Return the process-wide TranscriptionService, loading the model on first call.
+    
+    Returns:
+        The shared TranscriptionService instance
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = TranscriptionService()
+    return _service
+
+
+class _LazyTranscriptionService:
+    """Stand-in for the singleton that defers model loading until first attribute access."""
+    
+    def __getattr__(self, name):
+        return getattr(get_transcription_service(), name)
+
+
+# Singleton instance (the model loads on first use, not at import)
+transcription_service = _LazyTranscriptionService()
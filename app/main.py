@@ -35,6 +35,7 @@ Path("logs").mkdir(exist_ok=True)
 from app.api.routes import create_app
 from app.queue.worker import background_worker
 from app.queue.job_queue import job_queue
+from app.inference.transcription import get_transcription_service
 
 # Create FastAPI app
 app = create_app()
@@ -47,6 +48,7 @@ async def startup_event():
     
     - Starts the background worker
     - Resets any stuck processing jobs
+    - Loads the transcription model
     - Logs startup information
     """
     logger.info("=" * 60)
@@ -57,6 +59,10 @@ async def startup_event():
     logger.info("Resetting processing jobs to queued...")
     job_queue.reset_processing_jobs()
     
+    # Load the transcription model before accepting jobs
+    logger.info("Loading transcription model...")
+    get_transcription_service()
+    
     # Start background worker
     logger.info("Starting background worker...")
     background_worker.start()
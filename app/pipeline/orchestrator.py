@@ -111,11 +111,14 @@ class PipelineOrchestrator:
             
         Environment Variables:
             PIPELINE_TARGET_SAMPLE_RATE - Target sample rate (default: 16000)
+            PIPELINE_RES_TYPE - librosa resampler, e.g. soxr_hq, kaiser_best (default: soxr_hq)
             PIPELINE_MIN_SILENCE_LEN - Min silence length in ms (default: 500)
             PIPELINE_SILENCE_THRESH - Silence threshold in dBFS (default: -40)
             PIPELINE_KEEP_SILENCE - Silence padding in ms (default: 200)
+            PIPELINE_SILENCE_DETECTION_METHOD - 'pydub' or 'silero' (default: pydub)
             PIPELINE_MIN_CHUNK_DURATION - Min chunk duration in seconds (default: 3.0)
             PIPELINE_MIN_SILENCE_GAP - Min silence gap in seconds (default: 0.5)
+            PIPELINE_TRANSCRIPTION_BATCH_SIZE - Chunks per Whisper forward pass (default: 8)
         """
         config = config or {}
         
@@ -130,22 +133,27 @@ class PipelineOrchestrator:
         
         # Step 1: Audio Resampling
         target_sample_rate = get_config('target_sample_rate', 16000, int)
+        res_type = get_config('res_type', 'soxr_hq', str)
         pipeline.add_step(AudioResamplingStep(
-            target_sample_rate=target_sample_rate
+            target_sample_rate=target_sample_rate,
+            res_type=res_type
         ))
-        logger.debug(f"AudioResamplingStep: target_sample_rate={target_sample_rate}")
+        logger.debug(f"AudioResamplingStep: target_sample_rate={target_sample_rate}, res_type={res_type}")
         
         # Step 2: Silence Detection
         min_silence_len = get_config('min_silence_len', 500, int)
         silence_thresh = get_config('silence_thresh', -40, int)
         keep_silence = get_config('keep_silence', 200, int)
+        silence_detection_method = get_config('silence_detection_method', 'pydub', str)
         pipeline.add_step(SilenceDetectionStep(
             min_silence_len=min_silence_len,
             silence_thresh=silence_thresh,
-            keep_silence=keep_silence
+            keep_silence=keep_silence,
+            detection_method=silence_detection_method
         ))
         logger.debug(f"SilenceDetectionStep: min_silence_len={min_silence_len}, "
-                    f"silence_thresh={silence_thresh}, keep_silence={keep_silence}")
+                    f"silence_thresh={silence_thresh}, keep_silence={keep_silence}, "
+                    f"detection_method={silence_detection_method}")
         
         # Step 3: Chunk Merging
         min_chunk_duration = get_config('min_chunk_duration', 3.0, float)
@@ -158,11 +166,14 @@ class PipelineOrchestrator:
                     f"min_silence_gap={min_silence_gap}")
         
         # Step 4: Chunk Transcription
+        transcription_batch_size = get_config('transcription_batch_size', 8, int)
         pipeline.add_step(ChunkTranscriptionStep(
             model=model,
             processor=processor,
-            device=device
+            device=device,
+            batch_size=transcription_batch_size
         ))
+        logger.debug(f"ChunkTranscriptionStep: batch_size={transcription_batch_size}")
         
         # Step 5: Duplicate Removal
         pipeline.add_step(DuplicateRemovalStep())
@@ -230,12 +241,14 @@ class PipelineOrchestrator:
         
         step_map = {
             'AudioResamplingStep': lambda: AudioResamplingStep(
-                target_sample_rate=get_config('target_sample_rate', 16000, int)
+                target_sample_rate=get_config('target_sample_rate', 16000, int),
+                res_type=get_config('res_type', 'soxr_hq', str)
             ),
             'SilenceDetectionStep': lambda: SilenceDetectionStep(
                 min_silence_len=get_config('min_silence_len', 500, int),
                 silence_thresh=get_config('silence_thresh', -40, int),
-                keep_silence=get_config('keep_silence', 200, int)
+                keep_silence=get_config('keep_silence', 200, int),
+                detection_method=get_config('silence_detection_method', 'pydub', str)
             ),
             'ChunkMergingStep': lambda: ChunkMergingStep(
                 min_chunk_duration=get_config('min_chunk_duration', 3.0, float),
@@ -244,7 +257,8 @@ class PipelineOrchestrator:
             'ChunkTranscriptionStep': lambda: ChunkTranscriptionStep(
                 model=model,
                 processor=processor,
-                device=device
+                device=device,
+                batch_size=get_config('transcription_batch_size', 8, int)
             ),
             'DuplicateRemovalStep': lambda: DuplicateRemovalStep(),
             'TranscriptionCombiningStep': lambda: TranscriptionCombiningStep(),
@@ -30,7 +30,7 @@ class AudioSplittingStep(PipelineStep):
     
     def process(self, context: PipelineContext) -> PipelineContext:
         """
-        Copy verse_slices_timestamps to verse_details and mark as ready for splitting.
+        Expose verse_slices_timestamps as verse_details and mark as ready for splitting.
         
         Now that we extract precise timings from word alignments for multi-ayah chunks,
         each ayah should get its own audio file with accurate timestamps.
@@ -42,12 +42,10 @@ class AudioSplittingStep(PipelineStep):
         
         self.logger.info(f"Processing {len(verse_slices_timestamps)} verses for audio splitting...")
         
-        # Simply copy all verses - they all have proper timing now
-        verse_details = []
+        # Verses are only read from here on, so share the dicts instead of copying each one
+        verse_details = list(verse_slices_timestamps)
         
-        for verse in verse_slices_timestamps:
-            verse_copy = verse.copy()
-            
+        for verse in verse_details:
             # Log if this was extracted from multi-ayah chunk
             if verse.get('extracted_from_multi_ayah', False):
                 self.logger.info(
@@ -55,8 +53,6 @@ class AudioSplittingStep(PipelineStep):
                     f"extracted from multi-ayah chunk with word alignments "
                     f"({verse['start_time']:.2f}s - {verse['end_time']:.2f}s)"
                 )
-            
-            verse_details.append(verse_copy)
         
         # Set verse_details in context
         context.verse_details = verse_details
@@ -29,7 +29,7 @@ class ChunkTranscriptionStep(PipelineStep):
           }
     """
     
-    def __init__(self, model, processor, device):
+    def __init__(self, model, processor, device, batch_size: int = 8):
         """
         Initialize chunk transcription step.
         
@@ -37,11 +37,13 @@ class ChunkTranscriptionStep(PipelineStep):
             model: Whisper model
             processor: Whisper processor
             device: Device to run model on (cuda/cpu)
+            batch_size: Number of chunks per Whisper forward pass (default: 8)
         """
         super().__init__()
         self.model = model
         self.processor = processor
         self.device = device
+        self.batch_size = batch_size
     
     def validate_input(self, context: PipelineContext) -> bool:
         """Validate that chunks are present."""
@@ -68,21 +70,22 @@ class ChunkTranscriptionStep(PipelineStep):
         sample_rate = context.sample_rate
         audio_array = context.audio_array
         
-        self.logger.info(f"Transcribing {len(chunks)} chunks...")
+        self.logger.info(f"Transcribing {len(chunks)} chunks (batch_size={self.batch_size})...")
+        
+        # Get audio chunks from array
+        chunk_audios = [
+            audio_array[int(chunk['start_time'] * sample_rate):int(chunk['end_time'] * sample_rate)]
+            for chunk in chunks
+        ]
+        
+        # Transcribe the chunks in batches
+        transcription_results = transcription_service.transcribe_batch(
+            chunk_audios, batch_size=self.batch_size
+        )
         
         transcriptions = []
         
-        for chunk in chunks:
-
-            audio_start = chunk['start_time']
-            audio_end = chunk['end_time']
-
-            # Get audio chunk from array
-            chunk_audio = audio_array[int(audio_start * sample_rate):int(audio_end * sample_rate)]
-
-            # Transcribe the chunk
-            transcription_result = transcription_service.transcribe_bytes(chunk_audio)
-            
+        for chunk, transcription_result in zip(chunks, transcription_results):
             # Extract text from result
             text = transcription_result.get('text', '')
             normalized_text = normalize_arabic_text(text)
@@ -43,6 +43,48 @@ class DuplicateRemovalStep(PipelineStep):
         matcher = SequenceMatcher(None, str1, str2)
         return matcher.ratio()
     
+    def _find_word_overlap(self, previous_words: list, current_words: list) -> tuple:
+        """
+        Find how many words at the start of current_words duplicate the end of previous_words.
+        
+        An exact overlap always wins over a fuzzy one, so the longest exact overlap is
+        searched first. Only lengths whose last word equals the last previous word can
+        match exactly, which keeps the common case to a handful of list comparisons.
+        The SequenceMatcher scan only runs when no exact overlap exists.
+        
+        Args:
+            previous_words: Words of the previous transcription
+            current_words: Words of the current transcription
+            
+        Returns:
+            Tuple of (overlap_length, similarity), (0, 0.0) if no overlap found
+        """
+        max_overlap = min(len(current_words), len(previous_words))
+        last_previous_word = previous_words[-1]
+        
+        # Exact match: try candidate lengths from longest to shortest
+        for overlap in range(max_overlap, 0, -1):
+            if current_words[overlap - 1] != last_previous_word:
+                continue
+            if previous_words[-overlap:] == current_words[:overlap]:
+                return overlap, 1.0
+        
+        # No exact match, try fuzzy match starting from longer overlaps
+        # (more likely to be real duplicates)
+        overlap_length = 0
+        best_similarity = 0.0
+        for overlap in range(max_overlap, 0, -1):
+            similarity = self.calculate_sequence_similarity(
+                previous_words[-overlap:], current_words[:overlap]
+            )
+            
+            # If similarity exceeds threshold and is better than previous matches
+            if similarity >= self.SIMILARITY_THRESHOLD and similarity > best_similarity:
+                overlap_length = overlap
+                best_similarity = similarity
+        
+        return overlap_length, best_similarity
+    
     def validate_input(self, context: PipelineContext) -> bool:
         """Validate that transcriptions are present."""
         if not context.transcriptions:
@@ -65,8 +107,10 @@ class DuplicateRemovalStep(PipelineStep):
         duplicates_removed = 0
         
         for i, transcription in enumerate(transcriptions):
-            # Create a copy of the transcription to modify
-            cleaned_trans = transcription.copy()
+            # Records are only copied when duplicate words are actually stripped;
+            # otherwise the original record is passed through as-is (consumers
+            # read duplicated_omitted_text with a '' default)
+            cleaned_trans = transcription
             
             # Skip first transcription as there's no previous one to compare
             if i == 0:
@@ -91,33 +135,12 @@ class DuplicateRemovalStep(PipelineStep):
             
             # Find overlapping words at the boundary
             # Check how many words from the end of previous match the start of current
-            max_overlap = min(len(current_words), len(previous_words))
-            overlap_length = 0
-            best_similarity = 0.0
-            
-            # Try different overlap lengths, starting from longer overlaps (more likely to be real duplicates)
-            for overlap in range(max_overlap, 0, -1):
-                prev_sequence = previous_words[-overlap:]
-                curr_sequence = current_words[:overlap]
-                
-                # First try exact match (faster)
-                if prev_sequence == curr_sequence:
-                    overlap_length = overlap
-                    best_similarity = 1.0
-                    break
-                
-                # If no exact match, try fuzzy match
-                similarity = self.calculate_sequence_similarity(prev_sequence, curr_sequence)
-                
-                # If similarity exceeds threshold and is better than previous matches
-                if similarity >= self.SIMILARITY_THRESHOLD and similarity > best_similarity:
-                    overlap_length = overlap
-                    best_similarity = similarity
-                    # Don't break - continue checking for longer exact matches
+            overlap_length, best_similarity = self._find_word_overlap(previous_words, current_words)
             
             # Remove duplicate words from current transcription
             if overlap_length > 0:
                 duplicates_removed += 1
+                cleaned_trans = transcription.copy()
                 remaining_words = current_words[overlap_length:]
                 omitted_words = current_words[:overlap_length]
                 
@@ -145,10 +168,6 @@ class DuplicateRemovalStep(PipelineStep):
                     f"Original: {len(current_words)} words, Cleaned: {len(remaining_words)} words. "
                     f"Omitted: '{cleaned_trans['duplicated_omitted_text']}'"
                 )
-            else:
-                # No duplicates found, set empty omitted text
-                cleaned_trans['duplicated_omitted_text'] = ''
-                cleaned_trans['duplicated_omitted_text_original'] = ''
             
             cleaned_transcriptions.append(cleaned_trans)
         
@@ -28,10 +28,15 @@ class SilenceDetectionStep(PipelineStep):
           }
     """
     
+    # Silero VAD model shared by all instances; a new pipeline
+    # (and therefore a new step) is created for every job
+    _shared_silero_vad = None
+    
     def __init__(self, 
                  min_silence_len: int = 500,
                  silence_thresh: int = -40,
-                 keep_silence: int = 200):
+                 keep_silence: int = 200,
+                 detection_method: str = 'pydub'):
         """
         Initialize silence detection step.
         
@@ -39,11 +44,13 @@ class SilenceDetectionStep(PipelineStep):
             min_silence_len: Minimum silence length in ms (default: 500ms)
             silence_thresh: Silence threshold in dBFS (default: -40)
             keep_silence: Amount of silence to keep at edges in ms (default: 200ms)
+            detection_method: 'pydub' (energy threshold) or 'silero' (Silero VAD)
         """
         super().__init__()
         self.min_silence_len = min_silence_len
         self.silence_thresh = silence_thresh
         self.keep_silence = keep_silence
+        self.detection_method = detection_method
     
     def validate_input(self, context: PipelineContext) -> bool:
         """Validate that audio data is present."""
@@ -62,33 +69,17 @@ class SilenceDetectionStep(PipelineStep):
         Returns:
             Context with audio chunks
         """
-        from pydub import AudioSegment
-        from pydub.silence import detect_nonsilent
-        
         audio_array = context.audio_array
         sample_rate = context.sample_rate
         
-        self.logger.info(
-            f"Detecting silence (min_len={self.min_silence_len}ms, "
-            f"thresh={self.silence_thresh}dBFS)"
-        )
+        nonsilent_ranges = None
+        if self.detection_method == 'silero':
+            nonsilent_ranges = self._detect_speech_with_silero(audio_array, sample_rate)
         
-        # Convert numpy array to pydub AudioSegment
-        audio_int16 = (audio_array * 32767).astype(np.int16)
-        audio_segment = AudioSegment(
-            audio_int16.tobytes(),
-            frame_rate=sample_rate,
-            sample_width=audio_int16.dtype.itemsize,
-            channels=1
-        )
+        if nonsilent_ranges is None:
+            nonsilent_ranges = self._detect_nonsilent_with_pydub(audio_array, sample_rate)
         
-        # Detect non-silent chunks
-        nonsilent_ranges = detect_nonsilent(
-            audio_segment,
-            min_silence_len=self.min_silence_len,
-            silence_thresh=self.silence_thresh,
-            seek_step=10
-        )
+        audio_duration_ms = round(1000 * len(audio_array) / sample_rate)
         
         # Convert to chunks
         chunks = []
@@ -106,7 +97,7 @@ class SilenceDetectionStep(PipelineStep):
             for idx, (start_ms, end_ms) in enumerate(nonsilent_ranges):
                 # Add silence padding
                 start_ms = max(0, start_ms - self.keep_silence)
-                end_ms = min(len(audio_segment), end_ms + self.keep_silence)
+                end_ms = min(audio_duration_ms, end_ms + self.keep_silence)
                 
                 # Convert to sample indices
                 start_sample = int(start_ms * sample_rate / 1000)
@@ -132,6 +123,7 @@ class SilenceDetectionStep(PipelineStep):
         
         # Add debug info
         context.add_debug_info(self.name, {
+            'detection_method': self.detection_method,
             'total_chunks': len(chunks),
             'chunks': [{
                 'chunk_index': c['chunk_index'],
@@ -142,3 +134,100 @@ class SilenceDetectionStep(PipelineStep):
         })
         
         return context
+    
+    def _detect_nonsilent_with_pydub(self, audio_array: np.ndarray, sample_rate: int) -> List[List[int]]:
+        """
+        Detect non-silent ranges (in ms) with pydub's energy threshold.
+        
+        Args:
+            audio_array: Audio data (float32)
+            sample_rate: Sample rate
+            
+        Returns:
+            List of [start_ms, end_ms] ranges
+        """
+        from pydub import AudioSegment
+        from pydub.silence import detect_nonsilent
+        
+        self.logger.info(
+            f"Detecting silence (min_len={self.min_silence_len}ms, "
+            f"thresh={self.silence_thresh}dBFS)"
+        )
+        
+        # Convert numpy array to pydub AudioSegment
+        # Scale straight into the int16 buffer (no full-length float temporary)
+        audio_int16 = np.empty(len(audio_array), dtype=np.int16)
+        np.multiply(audio_array, 32767, out=audio_int16, casting='unsafe')
+        audio_segment = AudioSegment(
+            audio_int16.tobytes(),
+            frame_rate=sample_rate,
+            sample_width=audio_int16.dtype.itemsize,
+            channels=1
+        )
+        
+        # Detect non-silent chunks
+        return detect_nonsilent(
+            audio_segment,
+            min_silence_len=self.min_silence_len,
+            silence_thresh=self.silence_thresh,
+            seek_step=10
+        )
+    
+    def _detect_speech_with_silero(self, audio_array: np.ndarray, sample_rate: int):
+        """
+        Detect speech ranges (in ms) with Silero VAD in a single pass over the audio.
+        
+        Args:
+            audio_array: Audio data (float32, 8kHz or 16kHz)
+            sample_rate: Sample rate
+            
+        Returns:
+            List of [start_ms, end_ms] ranges, or None if Silero VAD is unavailable or fails
+        """
+        try:
+            import torch
+            model, get_speech_timestamps = self._load_silero_vad()
+        except Exception as e:
+            self.logger.warning(f"Silero VAD unavailable ({e}), falling back to pydub")
+            return None
+        
+        self.logger.info(f"Detecting speech with Silero VAD (min_silence={self.min_silence_len}ms)")
+        
+        try:
+            speech_timestamps = get_speech_timestamps(
+                torch.from_numpy(np.ascontiguousarray(audio_array, dtype=np.float32)),
+                model,
+                sampling_rate=sample_rate,
+                min_silence_duration_ms=self.min_silence_len,
+                speech_pad_ms=0  # keep_silence padding is applied by process()
+            )
+        except Exception as e:
+            # e.g. ValueError for sample rates Silero does not support
+            self.logger.warning(f"Silero VAD failed ({e}), falling back to pydub")
+            return None
+        
+        return [
+            [ts['start'] * 1000 // sample_rate, ts['end'] * 1000 // sample_rate]
+            for ts in speech_timestamps
+        ]
+    
+    def _load_silero_vad(self):
+        """
+        Load Silero VAD once per process and share it between steps.
+        
+        Returns:
+            Tuple of (model, get_speech_timestamps)
+        """
+        cls = type(self)
+        if cls._shared_silero_vad is None:
+            self.logger.info("Loading Silero VAD model...")
+            try:
+                from silero_vad import load_silero_vad, get_speech_timestamps
+                model = load_silero_vad()
+            except ImportError:
+                import torch
+                model, utils = torch.hub.load('snakers4/silero-vad', 'silero_vad')
+                get_speech_timestamps = utils[0]
+            cls._shared_silero_vad = (model, get_speech_timestamps)
+        
+        return cls._shared_silero_vad
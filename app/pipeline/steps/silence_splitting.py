@@ -4,6 +4,7 @@ Silence Splitting Step - Step 9 of the pipeline.
 Splits silence between consecutive verses.
 """
 
+import numpy as np
 from app.pipeline.base import PipelineStep, PipelineContext
 
 
@@ -38,61 +39,45 @@ class SilenceSplittingStep(PipelineStep):
         
         self.logger.info(f"Splitting silence for {len(verse_slices_timestamps)} verses...")
         
-        # Process each verse and calculate normalized timestamps
+        # Work on flat start/end arrays so the gap arithmetic and the
+        # statistics below are single NumPy operations instead of per-verse loops
+        start_times = np.array([v['start_time'] for v in verse_slices_timestamps], dtype=np.float64)
+        end_times = np.array([v['end_time'] for v in verse_slices_timestamps], dtype=np.float64)
+        
+        # Verses with 0 duration (reused chunks from multi-ayah case) get no gap
+        has_duration = (end_times - start_times) > 0
+        
+        # Gap with previous verse (first verse has no previous gap)
+        gap_durations = np.zeros_like(start_times)
+        gap_durations[1:] = start_times[1:] - end_times[:-1]
+        gap_durations[~has_duration] = 0.0
+        half_gaps = gap_durations / 2.0
+        
+        # Adjust start time by subtracting half the gap
+        normalized_start_times = np.where(has_duration, start_times - half_gaps, 0.0)
+        
+        # End times stay as-is unless the next verse gives back the other half of its gap
+        normalized_end_times = np.where(has_duration, end_times, 0.0)
+        next_has_duration = np.zeros_like(has_duration)
+        next_has_duration[:-1] = has_duration[1:]
+        next_half_gaps = np.zeros_like(half_gaps)
+        next_half_gaps[:-1] = half_gaps[1:]
+        normalized_end_times = np.where(next_has_duration, end_times + next_half_gaps, normalized_end_times)
+        
+        normalized_durations = normalized_end_times - normalized_start_times
+        
+        # Write results back onto the verse dicts
         for i, verse in enumerate(verse_slices_timestamps):
-            start_time = verse['start_time']
-            end_time = verse['end_time']
-            duration = end_time - start_time
-            
-            # Skip verses with 0 duration (reused chunks from multi-ayah case)
-            if duration <= 0:
+            if not has_duration[i]:
                 self.logger.debug(
                     f"Skipping silence splitting for verse {verse['surah_number']}:{verse['ayah_number']} "
                     f"(0 duration - chunk reuse case)"
                 )
-                verse['prev_gap_duration'] = 0.0
-                verse['normalized_start_time'] = 0.0
-                verse['normalized_end_time'] = 0.0
-                verse['normalized_duration'] = 0.0
-                continue
-            
-            # Calculate gap with previous verse
-            if i > 0:
-                prev_verse = verse_slices_timestamps[i - 1]
-                prev_end_time = prev_verse['end_time']
-                
-                # Calculate silence gap duration
-                gap_duration = start_time - prev_end_time
-                
-                # Split the gap in half
-                half_gap = gap_duration / 2.0
-                
-                # Adjust start time by subtracting half the gap
-                normalized_start_time = start_time - half_gap
-                
-                # Also update the previous verse's normalized_end_time
-                # (add the other half of the gap to its end)
-                prev_verse['normalized_end_time'] = prev_end_time + half_gap
-                prev_verse['normalized_duration'] = prev_verse['normalized_end_time'] - prev_verse['normalized_start_time']
-            else:
-                # First verse: no previous gap, start from original start_time
-                gap_duration = 0.0
-                normalized_start_time = start_time
             
-            # Store gap duration and normalized start time
-            verse['prev_gap_duration'] = gap_duration
-            verse['normalized_start_time'] = normalized_start_time
-            
-            # For now, set normalized_end_time to original end_time
-            # It will be updated when processing the next verse
-            verse['normalized_end_time'] = end_time
-            verse['normalized_duration'] = verse['normalized_end_time'] - verse['normalized_start_time']
-        
-        # Handle the last verse: extend to original end_time (no next verse to split with)
-        if verse_slices_timestamps:
-            last_verse = verse_slices_timestamps[-1]
-            # Last verse keeps its original end_time as normalized_end_time
-            last_verse['normalized_duration'] = last_verse['normalized_end_time'] - last_verse['normalized_start_time']
+            verse['prev_gap_duration'] = float(gap_durations[i])
+            verse['normalized_start_time'] = float(normalized_start_times[i])
+            verse['normalized_end_time'] = float(normalized_end_times[i])
+            verse['normalized_duration'] = float(normalized_durations[i])
         
         # Save back to context
         context.verse_slices_timestamps = verse_slices_timestamps
@@ -100,8 +85,8 @@ class SilenceSplittingStep(PipelineStep):
         self.logger.info(f"Completed silence splitting for {len(verse_slices_timestamps)} verses")
         
         # Calculate statistics
-        total_gap_duration = sum(v.get('prev_gap_duration', 0) for v in verse_slices_timestamps)
-        avg_gap_duration = total_gap_duration / len(verse_slices_timestamps) if verse_slices_timestamps else 0
+        total_gap_duration = float(gap_durations.sum())
+        avg_gap_duration = float(gap_durations.mean()) if len(gap_durations) else 0
         
         context.add_debug_info(self.name, {
             'total_verses': len(verse_slices_timestamps),
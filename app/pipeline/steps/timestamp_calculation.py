@@ -5,6 +5,7 @@ Calculates accurate timestamps for each verse.
 """
 
 from app.pipeline.base import PipelineStep, PipelineContext
+from itertools import chain
 
 
 class TimestampCalculationStep(PipelineStep):
@@ -204,10 +205,9 @@ class TimestampCalculationStep(PipelineStep):
             duration = end_time - start_time
             
             # Collect all word alignments from chunks
-            all_word_alignments = []
-            for chunk in chunks:
-                if 'word_alignments' in chunk:
-                    all_word_alignments.extend(chunk['word_alignments'])
+            all_word_alignments = list(chain.from_iterable(
+                chunk['word_alignments'] for chunk in chunks if 'word_alignments' in chunk
+            ))
             
             # Create verse entry with timing information
             verse_entry = {
@@ -279,16 +279,16 @@ class TimestampCalculationStep(PipelineStep):
         ayah_start_idx = None
         ayah_end_idx = None
         
-        # Try to find the ayah words as a contiguous sequence in chunk words
-        for i in range(len(chunk_words) - len(ayah_words) + 1):
-            # Check if ayah words match chunk words starting at position i
-            match = True
-            for j, ayah_word in enumerate(ayah_words):
-                if i + j >= len(chunk_words) or chunk_words[i + j] != ayah_word:
-                    match = False
-                    break
+        # Try to find the ayah words as a contiguous sequence in chunk words.
+        # Only positions holding the ayah's first word can start a match, so
+        # compare whole slices at those positions instead of scanning every offset
+        first_ayah_word = ayah_words[0]
+        last_start = len(chunk_words) - len(ayah_words)
+        for i, chunk_word in enumerate(chunk_words[:last_start + 1]):
+            if chunk_word != first_ayah_word:
+                continue
             
-            if match:
+            if chunk_words[i:i + len(ayah_words)] == ayah_words:
                 ayah_start_idx = i
                 ayah_end_idx = i + len(ayah_words)
                 break
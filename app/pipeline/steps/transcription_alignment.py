@@ -10,7 +10,7 @@ import os
 import json
 import csv
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import numpy as np
 import soundfile as sf
 from app.pipeline.base import PipelineStep, PipelineContext
@@ -35,6 +35,13 @@ class TranscriptionAlignmentStep(PipelineStep):
         - matched_chunk_verses: Updated with word_alignments field
     """
     
+    # Arabic-specific model trained on Common Voice Arabic
+    WAV2VEC2_MODEL_NAME = "jonatasgrosman/wav2vec2-large-xlsr-53-arabic"
+    
+    # (processor, model, device) shared by all instances; a new pipeline
+    # (and therefore a new step) is created for every job
+    _shared_wav2vec2 = None
+    
     def __init__(self, alignment_method: str = 'wav2vec2', language: str = 'ar'):
         """
         Initialize the alignment step.
@@ -50,6 +57,7 @@ class TranscriptionAlignmentStep(PipelineStep):
         self.language = language
         self.wav2vec2_model = None  # Lazy load
         self.wav2vec2_processor = None
+        self.wav2vec2_device = "cpu"
         self.logger.info(f"Initialized with alignment_method={alignment_method}, language={language}")
     
     def validate_input(self, context: PipelineContext) -> bool:
@@ -107,12 +115,13 @@ class TranscriptionAlignmentStep(PipelineStep):
             # The duplicate_removal step stores omitted text that was removed from chunk boundaries
             # We need to include it during alignment to get accurate word timings
             duplicated_omitted_text = chunk_data.get('duplicated_omitted_text', '')
+            num_omitted_words = len(duplicated_omitted_text.split())
             
             # Construct full text for alignment (omitted + current)
             if duplicated_omitted_text:
                 full_normalized_text = duplicated_omitted_text + ' ' + normalized_text
                 self.logger.debug(
-                    f"Chunk {chunk_index}: Including {len(duplicated_omitted_text.split())} omitted words. "
+                    f"Chunk {chunk_index}: Including {num_omitted_words} omitted words. "
                     f"Full text: '{full_normalized_text[:100]}...'"
                 )
             else:
@@ -148,7 +157,6 @@ class TranscriptionAlignmentStep(PipelineStep):
                 # Filter word alignments to exclude omitted duplicate words
                 # Keep only the words that are in the current (non-omitted) text
                 if duplicated_omitted_text and full_word_alignments:
-                    num_omitted_words = len(duplicated_omitted_text.split())
                     # Skip the first N words (omitted duplicates)
                     word_alignments = full_word_alignments[num_omitted_words:]
                     
@@ -225,7 +233,7 @@ class TranscriptionAlignmentStep(PipelineStep):
         try:
             import torch
             import torchaudio
-            from transformers import Wav2Vec2ForCTC, Wav2Vec2Processor
+            import transformers  # noqa: F401
         except ImportError:
             self.logger.error("torch/torchaudio/transformers not available for forced alignment")
             return self._align_with_dtw(audio, text, sample_rate, chunk_start_time)
@@ -237,13 +245,7 @@ class TranscriptionAlignmentStep(PipelineStep):
         try:
             # Lazy load Arabic Wav2Vec2 model
             if self.wav2vec2_model is None:
-                self.logger.info("Loading Arabic Wav2Vec2 model for forced alignment...")
-                # Use Arabic-specific model trained on Common Voice Arabic
-                model_name = "jonatasgrosman/wav2vec2-large-xlsr-53-arabic"
-                self.wav2vec2_processor = Wav2Vec2Processor.from_pretrained(model_name)
-                self.wav2vec2_model = Wav2Vec2ForCTC.from_pretrained(model_name)
-                self.wav2vec2_model.eval()
-                self.logger.info(f"Loaded Arabic Wav2Vec2 model: {model_name}")
+                self._load_wav2vec2_model()
             
             # Resample to 16kHz if needed (Wav2Vec2 requirement)
             target_sr = 16000
@@ -263,7 +265,7 @@ class TranscriptionAlignmentStep(PipelineStep):
             
             # Get emissions from model
             with torch.inference_mode():
-                logits = self.wav2vec2_model(audio_tensor.unsqueeze(0)).logits
+                logits = self.wav2vec2_model(audio_tensor.unsqueeze(0).to(self.wav2vec2_device)).logits
                 emissions = torch.log_softmax(logits, dim=-1)
             
             emission = emissions[0].cpu().detach()
@@ -305,6 +307,9 @@ class TranscriptionAlignmentStep(PipelineStep):
             current_word_frames = []
             word_idx = 0
             
+            # Seconds per emission frame
+            ratio = len(audio) / sample_rate / emission.shape[0]
+            
             for i, (token_id, frame_idx) in enumerate(token_spans):
                 token_str = decoded_tokens[i] if i < len(decoded_tokens) else ""
                 current_word_tokens.append(token_str)
@@ -318,7 +323,6 @@ class TranscriptionAlignmentStep(PipelineStep):
                 
                 if is_word_end and current_word_frames and word_idx < len(words):
                     # Calculate timing for this word
-                    ratio = len(audio) / sample_rate / emission.shape[0]
                     start_frame = current_word_frames[0]
                     end_frame = current_word_frames[-1]
                     
@@ -350,6 +354,29 @@ class TranscriptionAlignmentStep(PipelineStep):
             self.logger.debug(traceback.format_exc())
             return self._align_with_dtw(audio, text, sample_rate, chunk_start_time)
     
+    def _load_wav2vec2_model(self):
+        """
+        Load the Arabic Wav2Vec2 model once per process and share it between steps.
+        
+        The model runs on GPU when available; emissions are moved back to CPU
+        for the trellis computation.
+        """
+        import torch
+        from transformers import Wav2Vec2ForCTC, Wav2Vec2Processor
+        
+        cls = type(self)
+        if cls._shared_wav2vec2 is None:
+            self.logger.info("Loading Arabic Wav2Vec2 model for forced alignment...")
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            processor = Wav2Vec2Processor.from_pretrained(self.WAV2VEC2_MODEL_NAME)
+            model = Wav2Vec2ForCTC.from_pretrained(self.WAV2VEC2_MODEL_NAME)
+            model.to(device)
+            model.eval()
+            cls._shared_wav2vec2 = (processor, model, device)
+            self.logger.info(f"Loaded Arabic Wav2Vec2 model: {self.WAV2VEC2_MODEL_NAME} on {device}")
+        
+        self.wav2vec2_processor, self.wav2vec2_model, self.wav2vec2_device = cls._shared_wav2vec2
+    
     def _get_trellis(self, emission, tokens, blank_id=0):
         """Build trellis for CTC alignment."""
         import torch
@@ -484,6 +511,9 @@ class TranscriptionAlignmentStep(PipelineStep):
             # Use DTW to align word count with energy peaks
             word_indices = np.linspace(0, len(words), len(peaks) + 2)
             
+            # Equal-division bounds for words that fall past the energy envelope
+            fallback_starts, fallback_ends = self._equal_division_bounds(len(words), 0.0, audio_duration)
+            
             for i, word in enumerate(words):
                 # Find corresponding time range
                 start_idx = int(word_indices[i])
@@ -492,12 +522,12 @@ class TranscriptionAlignmentStep(PipelineStep):
                 if start_idx < len(times):
                     word_start = times[start_idx]
                 else:
-                    word_start = (i / len(words)) * audio_duration
+                    word_start = fallback_starts[i]
                 
                 if end_idx < len(times):
                     word_end = times[end_idx]
                 else:
-                    word_end = ((i + 1) / len(words)) * audio_duration
+                    word_end = fallback_ends[i]
                 
                 word_alignments.append({
                     'word': word,
@@ -512,6 +542,27 @@ class TranscriptionAlignmentStep(PipelineStep):
             self.logger.warning(f"DTW alignment failed: {e}, using simple division")
             return self._simple_equal_division(audio, text, sample_rate, chunk_start_time)
     
+    def _equal_division_bounds(
+        self,
+        num_words: int,
+        start: float,
+        duration: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split a time span into equal per-word slots.
+        
+        Args:
+            num_words: Number of words to place
+            start: Start time of the span in seconds
+            duration: Length of the span in seconds
+            
+        Returns:
+            (starts, ends) arrays of word boundaries in seconds
+        """
+        word_duration = duration / num_words
+        starts = start + np.arange(num_words) * word_duration
+        return starts, starts + word_duration
+    
     def _simple_equal_division(
         self,
         audio: np.ndarray,
@@ -535,19 +586,16 @@ class TranscriptionAlignmentStep(PipelineStep):
         if not words:
             return []
         
-        audio_duration = len(audio) / sample_rate
-        word_duration = audio_duration / len(words)
+        starts, ends = self._equal_division_bounds(
+            len(words), chunk_start_time, len(audio) / sample_rate
+        )
         
-        alignments = []
-        for i, word in enumerate(words):
-            word_start = chunk_start_time + (i * word_duration)
-            word_end = word_start + word_duration
-            
-            alignments.append({
+        return [
+            {
                 'word': word,
-                'start': round(word_start, 3),
-                'end': round(word_end, 3),
+                'start': start,
+                'end': end,
                 'confidence': 0.3  # Low confidence for simple method
-            })
-        
-        return alignments
+            }
+            for word, start, end in zip(words, np.round(starts, 3).tolist(), np.round(ends, 3).tolist())
+        ]
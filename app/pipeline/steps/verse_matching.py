@@ -8,6 +8,7 @@ from app.pipeline.base import PipelineStep, PipelineContext
 import quran_ayah_lookup as qal
 from rapidfuzz import fuzz, process
 from difflib import SequenceMatcher
+from itertools import accumulate
 
 class VerseMatchingStep(PipelineStep):
     """
@@ -144,22 +145,16 @@ class VerseMatchingStep(PipelineStep):
         cleaned_transcriptions = context.cleaned_transcriptions
         
         # Step 8: Prepare verses within the matched boundaries
-        # Only process verses that are within the start/end boundaries
-        verses_in_range = []
-        for verse in best_match.verses:
-            verse_position = (verse.surah_number, verse.ayah_number)
-            start_position = (match_boundaries['start_surah'], match_boundaries['start_ayah'])
-            end_position = (match_boundaries['end_surah'], match_boundaries['end_ayah'])
-            
-            if start_position <= verse_position <= end_position:
-                verses_in_range.append({
-                    'text_normalized': verse.text_normalized,
-                    'surah_number': verse.surah_number,
-                    'ayah_number': verse.ayah_number,
-                    'text': verse.text,
-                    'is_basmalah': verse.is_basmalah,
-                    'word_count': len(verse.text_normalized.split())
-                })
+        # Only process verses that are within the start/end boundaries.
+        # Reuse the ayah dicts extracted in Step 4 rather than walking the
+        # verse objects a second time.
+        start_position = (match_boundaries['start_surah'], match_boundaries['start_ayah'])
+        end_position = (match_boundaries['end_surah'], match_boundaries['end_ayah'])
+        verses_in_range = [
+            dict(ayah, word_count=len(ayah['text_normalized'].split()))
+            for ayah in matched_ayahs
+            if start_position <= (ayah['surah_number'], ayah['ayah_number']) <= end_position
+        ]
         
         self.logger.info(f"Found {len(verses_in_range)} verses in range")
         
@@ -353,7 +348,7 @@ class VerseMatchingStep(PipelineStep):
     
     def _find_best_chunk_match(self, verse_text: str, chunks: list, start_idx: int, target_word_count: int) -> dict:
         """
-        Find the best chunk combination for a verse using SequenceMatcher.
+        Find the best chunk combination for a verse using fuzzy similarity.
         
         This handles cases where a chunk starts in the middle of an ayah and extends
         to the middle/end of the next ayah. We try combining consecutive chunks
@@ -376,26 +371,33 @@ class VerseMatchingStep(PipelineStep):
             f"Trying to match verse ({target_word_count} words) using chunks {start_idx} to {start_idx + max_chunks_to_try - 1}"
         )
         
+        # Build every candidate combination (consecutive chunk prefixes) up front
+        # so they can be scored in a single batched rapidfuzz call instead of
+        # one pure-Python SequenceMatcher per combination.
+        # Join once and take each prefix as a slice up to the end of its last chunk.
+        chunk_texts = [c.get('normalized_text', '') for c in chunks[start_idx:start_idx + max_chunks_to_try]]
+        combined_text = ' '.join(chunk_texts)
+        candidate_texts = [
+            combined_text[:text_end - 1]
+            for text_end in accumulate(len(chunk_text) + 1 for chunk_text in chunk_texts)
+        ]
+        candidate_word_counts = list(accumulate(len(chunk_text.split()) for chunk_text in chunk_texts))
+        
+        if not candidate_texts:
+            return None
+        
+        # Calculate similarity for all combinations at once (0-100 -> 0-1)
+        similarities = process.cdist([verse_text], candidate_texts, scorer=fuzz.ratio)[0] / 100.0
+        
         best_match = None
         best_similarity = 0.0
         best_word_diff = float('inf')
         
-        for num_chunks in range(1, max_chunks_to_try + 1):
+        for num_chunks in range(1, len(candidate_texts) + 1):
             end_idx = start_idx + num_chunks
-            if end_idx > len(chunks):
-                break
-            
-            # Get chunks for this combination
-            chunk_combination = chunks[start_idx:end_idx]
-            
-            # Combine chunk texts
-            combined_text = ' '.join(c.get('normalized_text', '') for c in chunk_combination)
-            total_words = len(combined_text.split())
+            total_words = candidate_word_counts[num_chunks - 1]
             word_diff = abs(total_words - target_word_count)
-            
-            # Calculate similarity using SequenceMatcher
-            matcher = SequenceMatcher(None, verse_text, combined_text)
-            similarity = matcher.ratio()
+            similarity = float(similarities[num_chunks - 1])
             
             # Check if this is a better match
             # Prioritize: 1) High similarity, 2) Low word difference
@@ -419,7 +421,7 @@ class VerseMatchingStep(PipelineStep):
             
             if is_better:
                 best_match = {
-                    'chunks': chunk_combination,
+                    'chunks': chunks[start_idx:end_idx],
                     'total_words': total_words,
                     'similarity': similarity,
                     'word_diff': word_diff,
@@ -458,7 +460,8 @@ class VerseMatchingStep(PipelineStep):
         
         chunk = current_chunks[0]
         chunk_text = chunk.get('normalized_text', '')
-        chunk_word_count = len(chunk_text.split())
+        chunk_words = chunk_text.split()
+        chunk_word_count = len(chunk_words)
         
         # Check if chunk is significantly longer than current verse
         current_verse = verses_in_range[current_verse_idx]
@@ -508,7 +511,6 @@ class VerseMatchingStep(PipelineStep):
         similarity = matcher.ratio()
         
         # Also check if chunk is a prefix of combined verses (partial ayah case)
-        chunk_words = chunk_text.split()
         combined_words = combined_verse_text.split()
         prefix_match = all(cw == vw for cw, vw in zip(chunk_words, combined_words[:len(chunk_words)]))
         
@@ -543,17 +545,18 @@ class VerseMatchingStep(PipelineStep):
             )
             
             # Try to find the remaining words in subsequent chunks
+            last_verse_words = last_verse['text_normalized'].split()
             while next_chunk_idx < len(all_chunks) and words_needed > 0:
                 next_chunk = all_chunks[next_chunk_idx]
                 next_chunk_words = len(next_chunk.get('normalized_text', '').split())
                 
                 # Check if this chunk contains part of the last ayah
                 # by checking if it matches the remaining text
-                remaining_verse_text = ' '.join(last_verse['text_normalized'].split()[-words_needed:])
+                remaining_verse_words = last_verse_words[-words_needed:]
                 next_chunk_text = next_chunk.get('normalized_text', '')
                 
                 # Check if next chunk starts with remaining verse text
-                if next_chunk_text.startswith(remaining_verse_text.split()[0]):
+                if next_chunk_text.startswith(remaining_verse_words[0]):
                     chunks_used.append(next_chunk)
                     words_needed -= next_chunk_words
                     next_chunk_idx += 1
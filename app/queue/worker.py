@@ -8,6 +8,8 @@ This module is responsible for:
 - Handling job results and errors
 """
 
+import os
+import shutil
 import threading
 import time
 import logging
@@ -153,9 +155,12 @@ class BackgroundWorker:
             # Step 3: Split audio into ayahs
             self.logger.info(f"[{job_id}] Splitting audio into ayahs...")
             
+            # silence_gaps metadata is optional; skipping it skips the silence scan
+            include_silence_gaps = os.getenv('SPLIT_SILENCE_GAPS', 'true').lower() in ('true', '1', 'yes')
             zip_buffer, zip_filename = split_audio_by_ayahs(
                 audio_file_path,
-                verse_details
+                verse_details,
+                include_silence_gaps=include_silence_gaps
             )
             
             # Step 4: Save result zip file
@@ -163,8 +168,8 @@ class BackgroundWorker:
             results_dir.mkdir(parents=True, exist_ok=True)
             
             result_zip_path = results_dir / f"{job_id}.zip"
-            with open(result_zip_path, 'wb') as f:
-                f.write(zip_buffer.getvalue())
+            with zip_buffer, open(result_zip_path, 'wb') as f:
+                shutil.copyfileobj(zip_buffer, f)
             
             self.logger.info(f"[{job_id}] Saved result to {result_zip_path}")
             
@@ -211,6 +216,10 @@ class BackgroundWorker:
             # Log debug summary even on failure
             if debug_recorder:
                 self.logger.info(debug_recorder.get_summary())
+        
+        finally:
+            if debug_recorder:
+                debug_recorder.close()
 
 
 # Singleton instance
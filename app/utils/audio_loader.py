@@ -4,8 +4,6 @@ Audio Loader Utility - Loads and prepares audio files.
 This module handles audio file loading with format conversion and validation.
 """
 
-import os
-import tempfile
 from pathlib import Path
 from typing import Tuple
 import librosa
@@ -79,23 +77,12 @@ def _load_with_pydub(file_path: str) -> Tuple[np.ndarray, int]:
     if audio.channels > 1:
         audio = audio.set_channels(1)
     
-    # Export to temporary WAV file (preserving sample rate)
-    temp_dir = tempfile.gettempdir()
-    temp_wav = os.path.join(temp_dir, f"temp_{os.getpid()}.wav")
-    audio.export(temp_wav, format="wav")
-    
-    try:
-        # Load the converted file with librosa (keep original sample rate)
-        audio_array, sample_rate = librosa.load(
-            temp_wav,
-            sr=None,  # Keep original sample rate
-            mono=True
-        )
-        return audio_array, sample_rate
-    finally:
-        # Clean up temporary file
-        if os.path.exists(temp_wav):
-            os.remove(temp_wav)
+    # Read the decoded PCM samples straight from the segment and scale them to
+    # [-1.0, 1.0) the same way librosa does for PCM WAV (no temp file round-trip)
+    samples = np.asarray(audio.get_array_of_samples())
+    audio_array = samples.astype(np.float32) / float(1 << (8 * audio.sample_width - 1))
+    
+    return audio_array, original_sample_rate
 
 
 def validate_audio(audio_array: np.ndarray, sample_rate: int = 16000) -> bool:
@@ -116,6 +103,10 @@ def validate_audio(audio_array: np.ndarray, sample_rate: int = 16000) -> bool:
     if len(audio_array) < sample_rate * 0.1:
         return False
     
+    # Reject digital silence (peak below -80 dBFS)
+    if float(np.max(np.abs(audio_array))) < 1e-4:
+        return False
+    
     return True
 
 
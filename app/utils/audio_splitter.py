@@ -4,13 +4,21 @@ Audio splitting module for splitting audio by ayahs.
 
 import io
 import os
+import re
 import json
 import logging
+import struct
+import subprocess
+import tempfile
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import IO, List, Dict, Tuple, Optional
 from pydub import AudioSegment
-from pydub.silence import detect_silence
+import numpy as np
+import soundfile as sf
 import zipfile
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +31,218 @@ def set_debug_recorder(recorder):
     _debug_recorder = recorder
 
 
+# Arabic diacritics (tashkeel and Quranic annotation marks)
+_DIACRITICS_RE = re.compile(r'[\u064B-\u065F\u0670\u0610-\u061A\u06D6-\u06ED]')
+
+# Alef variants -> bare alef, ta marbuta -> ha
+_LETTER_NORMALIZATION = str.maketrans({'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ة': 'ه'})
+
+
+@lru_cache(maxsize=8192)
+def _normalize_ayah_text(ayah_text: str) -> str:
+    """
+    Basic normalization of ayah text (remove diacritics, unify alef/ta marbuta).
+    
+    Ayah texts come from a fixed corpus, so results are cached across jobs.
+    """
+    normalized = _DIACRITICS_RE.sub('', ayah_text).translate(_LETTER_NORMALIZATION)
+    return ' '.join(normalized.split())
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp_ms(timestamp: str) -> int:
+    """
+    Convert "HH:MM:SS.mmm" to milliseconds (raises on malformed input).
+    
+    The fixed-width layout the pipeline emits is decoded digit by digit;
+    anything else goes through the generic split/int path.
+    """
+    digits = timestamp.encode()
+    if (len(digits) == 12 and digits[2] == 58 and digits[5] == 58 and digits[8] == 46
+            and digits[:2].isdigit() and digits[3:5].isdigit()
+            and digits[6:8].isdigit() and digits[9:].isdigit()):
+        d = [c - 48 for c in digits]
+        return (
+            ((d[0] * 10 + d[1]) * 3600 + (d[3] * 10 + d[4]) * 60 + d[6] * 10 + d[7]) * 1000
+            + d[9] * 100 + d[10] * 10 + d[11]
+        )
+    
+    # Split into time and milliseconds
+    time_part, ms_part = timestamp.split('.')
+    hours, minutes, seconds = map(int, time_part.split(':'))
+    
+    # Convert to total milliseconds
+    return (hours * 3600 + minutes * 60 + seconds) * 1000 + int(ms_part)
+
+
+def _wav_bytes(segment: AudioSegment) -> bytes:
+    """
+    Serialize a segment as a PCM WAV file (same bytes as segment.export(format='wav')).
+    
+    The PCM is already in memory, so the 44-byte RIFF header is packed
+    directly instead of going through pydub's export and the wave module.
+    """
+    pcm = segment.raw_data
+    if segment.sample_width == 1:
+        # WAV stores 8-bit samples unsigned
+        pcm = (np.frombuffer(pcm, dtype=np.int8).view(np.uint8) + np.uint8(128)).tobytes()
+    
+    return _wav_header(len(pcm), segment.channels, segment.frame_rate, segment.sample_width) + pcm
+
+
+@lru_cache(maxsize=32)
+def _wav_header(data_size: int, channels: int, frame_rate: int, sample_width: int) -> bytes:
+    """44-byte PCM WAV header; equal-length segments of a track share one."""
+    block_align = channels * sample_width
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, frame_rate,
+        frame_rate * block_align, block_align, sample_width * 8,
+        b'data', data_size
+    )
+
+
+@lru_cache(maxsize=8192)
+def _format_timestamp_ms(milliseconds: int) -> str:
+    """Convert integer milliseconds to "HH:MM:SS.mmm"."""
+    total_seconds, ms = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms:03d}"
+
+
+def _energy_cumsum(audio: AudioSegment) -> np.ndarray:
+    """
+    Cumulative sum of squared samples per frame, computed once per track.
+    
+    Args:
+        audio: Full audio segment
+        
+    Returns:
+        Array of length frame_count + 1 (int64 is exact for 8/16-bit audio)
+    """
+    samples = np.asarray(audio.get_array_of_samples())
+    if audio.sample_width <= 2:
+        # 8/16-bit squares fit in int32 (<= 2**30); only the sums need int64
+        squares = samples.astype(np.int32)
+        squares *= squares
+        energy_dtype = np.int64
+    else:
+        squares = np.square(samples, dtype=np.float64)
+        energy_dtype = np.float64
+    
+    if audio.channels > 1:
+        frame_energy = squares.reshape(-1, audio.channels).sum(axis=1, dtype=energy_dtype)
+    else:
+        frame_energy = squares
+    
+    energy_csum = np.empty(len(frame_energy) + 1, dtype=energy_dtype)
+    energy_csum[0] = 0
+    np.cumsum(frame_energy, dtype=energy_dtype, out=energy_csum[1:])
+    return energy_csum
+
+
+def _detect_silence(
+    audio: AudioSegment,
+    energy_csum: np.ndarray,
+    start_ms: int,
+    end_ms: int,
+    min_silence_len: int,
+    silence_thresh: float
+) -> List[List[int]]:
+    """
+    Vectorized equivalent of pydub.silence.detect_silence(audio[start_ms:end_ms]).
+    
+    pydub slices the segment and recomputes the RMS of every 1ms-stepped
+    window in Python; here the window energies are looked up in the track's
+    cumulative energy, so no audio is sliced and the scan is O(window count).
+    
+    Args:
+        audio: Full audio segment
+        energy_csum: _energy_cumsum(audio)
+        start_ms: Start of the region to scan (ms)
+        end_ms: End of the region to scan (ms)
+        min_silence_len: Minimum silence length in ms
+        silence_thresh: Silence threshold in dBFS
+        
+    Returns:
+        List of [start_ms, end_ms] silent ranges, relative to start_ms
+    """
+    frames_per_ms = audio.frame_rate / 1000.0
+    num_frames = len(energy_csum) - 1
+    
+    # Same frame boundaries and length as pydub's audio[start_ms:end_ms]
+    total_ms = len(audio)
+    first_frame = int(min(start_ms, total_ms) * frames_per_ms)
+    last_frame = int(min(end_ms, total_ms) * frames_per_ms)
+    seg_len = round(1000 * (float(last_frame - first_frame) / audio.frame_rate))
+    if seg_len < min_silence_len:
+        return []
+    
+    # Same window boundaries as pydub's segment[i:i + min_silence_len];
+    # frames past the end of the data count as (zero-padded) silence
+    window_starts = np.arange(seg_len - min_silence_len + 1)
+    start_frames = (window_starts * frames_per_ms).astype(np.int64)
+    end_frames = ((window_starts + min_silence_len) * frames_per_ms).astype(np.int64)
+    data_end = min(last_frame, num_frames)
+    window_energy = (
+        energy_csum[np.minimum(first_frame + end_frames, data_end)]
+        - energy_csum[np.minimum(first_frame + start_frames, data_end)]
+    )
+    window_len = np.maximum((end_frames - start_frames) * audio.channels, 1)
+    
+    # pydub tests int(rms) <= thresh, i.e. rms < floor(thresh) + 1; squared and
+    # multiplied out, that is an exact integer test with no sqrt or division
+    thresh = 10 ** (silence_thresh / 20) * audio.max_possible_amplitude
+    energy_limit = (int(thresh) + 1) ** 2
+    if audio.sample_width <= 2:
+        silent = window_energy < energy_limit * window_len
+    else:
+        # 32-bit energies are float64 already, and energy_limit * window_len
+        # would overflow int64 for any non-trivial threshold
+        silent = window_energy < float(energy_limit) * window_len
+    silence_starts = window_starts[silent]
+    
+    if not silence_starts.size:
+        return []
+    
+    # Overlapping or touching silent windows merge into one range
+    breaks = np.flatnonzero(np.diff(silence_starts) > min_silence_len) + 1
+    range_starts = silence_starts[np.concatenate(([0], breaks))]
+    range_ends = silence_starts[np.concatenate((breaks - 1, [len(silence_starts) - 1]))] + min_silence_len
+    
+    return [[int(start), int(end)] for start, end in zip(range_starts, range_ends)]
+
+
 class AudioSplitter:
     """Handles splitting audio files into individual ayah segments."""
     
+    # pydub export format and options per file extension (anything else is exported as WAV)
+    EXPORT_FORMATS = {
+        '.mp3': ('mp3', {'bitrate': '192k'}),
+        '.wav': ('wav', {}),
+        '.m4a': ('ipod', {}),
+        '.ogg': ('ogg', {}),
+        '.flac': ('flac', {}),
+    }
+    
+    # Concurrent ayah exports; each one runs its own ffmpeg process
+    EXPORT_WORKERS = os.cpu_count() or 1
+    
+    # Zip size kept in memory before spilling to a temporary file
+    ZIP_SPOOL_MAX_BYTES = 32 * 1024 * 1024
+    
+    # Already-compressed audio is stored as-is in the zip (deflate gains ~nothing)
+    STORED_EXTENSIONS = {'.mp3', '.m4a', '.ogg', '.flac'}
+    
+    # Sources decoded in-process by libsndfile (pydub would spawn ffmpeg for them)
+    SOUNDFILE_FORMATS = {'.flac', '.ogg'}
+    
+    # Sources cut with ffmpeg stream copy (no decode/re-encode); m4a/ogg need
+    # sample-accurate cuts, WAV/FLAC re-encode cheaply, so those use pydub
+    STREAM_COPY_FORMATS = {'.mp3': 'mp3'}
+    
     def __init__(self):
         """Initialize the audio splitter."""
         pass
@@ -41,16 +258,9 @@ class AudioSplitter:
             Time in milliseconds
         """
         try:
-            # Split into time and milliseconds
-            time_part, ms_part = timestamp.split('.')
-            hours, minutes, seconds = map(int, time_part.split(':'))
-            milliseconds = int(ms_part)
-            
-            # Convert to total milliseconds
-            total_ms = (hours * 3600 + minutes * 60 + seconds) * 1000 + milliseconds
-            return total_ms
+            return _parse_timestamp_ms(timestamp)
         except Exception as e:
-            logger.error(f"Error parsing timestamp '{timestamp}': {e}")
+            logger.error("Error parsing timestamp '%s': %s", timestamp, e)
             return 0
     
     def _format_timestamp(self, milliseconds: int) -> str:
@@ -63,81 +273,51 @@ class AudioSplitter:
         Returns:
             Timestamp in format "HH:MM:SS.mmm"
         """
-        try:
-            total_seconds = milliseconds // 1000
-            ms = milliseconds % 1000
-            
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{ms:03d}"
-        except Exception as e:
-            logger.error(f"Error formatting timestamp '{milliseconds}': {e}")
-            return "00:00:00.000"
+        return _format_timestamp_ms(milliseconds)
     
-    def _detect_silence_gaps_in_segment(
+    def _silence_in_range(
         self,
-        segment: AudioSegment,
-        threshold_ms: int = 500
+        track_silences: List[List[int]],
+        silence_starts: List[int],
+        start_ms: int,
+        end_ms: int
     ) -> List[Dict]:
         """
-        Detect silence gaps within an ayah segment (excluding leading/trailing silences).
+        Pick the silence gaps inside an ayah segment (excluding leading/trailing silences).
         
         Args:
-            segment: Audio segment for the ayah
-            threshold_ms: Minimum silence duration to detect (milliseconds)
+            track_silences: [start_ms, end_ms] silences of the whole track, sorted
+            silence_starts: Start times of track_silences (for bisect)
+            start_ms: Start of the ayah segment (ms)
+            end_ms: End of the ayah segment (ms)
             
         Returns:
-            List of silence gap dictionaries (only internal gaps)
+            List of silence gap dictionaries (only internal gaps, relative to start_ms)
         """
+        segment_duration_ms = end_ms - start_ms
+        
+        # Define margins to exclude leading/trailing silences
+        # Consider first/last 10% of audio as edge regions
+        leading_margin = start_ms + segment_duration_ms * 0.1
+        trailing_margin = start_ms + segment_duration_ms * 0.9
+        
         silence_gaps = []
+        for silence_start, silence_end in track_silences[bisect_left(silence_starts, leading_margin):]:
+            if silence_start > trailing_margin:
+                break
+            
+            if silence_end > trailing_margin:
+                logger.debug("Skipping trailing silence at %dms", silence_end - start_ms)
+                continue
+            
+            silence_gaps.append({
+                "silence_start_ms": silence_start - start_ms,
+                "silence_end_ms": silence_end - start_ms,
+                "silence_duration_ms": silence_end - silence_start
+            })
         
-        try:
-            # Detect silence in the segment
-            from pydub.silence import detect_silence
-            
-            # Detect silences longer than threshold_ms with -40dBFS threshold
-            silences = detect_silence(
-                segment,
-                min_silence_len=threshold_ms,
-                silence_thresh=-40
-            )
-            
-            if not silences:
-                return []
-            
-            segment_duration_ms = len(segment)
-            
-            # Define margins to exclude leading/trailing silences
-            # Consider first/last 10% of audio as edge regions
-            leading_margin = segment_duration_ms * 0.1
-            trailing_margin = segment_duration_ms * 0.9
-            
-            # Process each silence, excluding those at edges
-            for silence_start, silence_end in silences:
-                # Skip silences that are at the very beginning or end
-                if silence_start < leading_margin:
-                    logger.debug(f"Skipping leading silence at {silence_start}ms")
-                    continue
-                
-                if silence_end > trailing_margin:
-                    logger.debug(f"Skipping trailing silence at {silence_end}ms")
-                    continue
-                
-                silence_duration = silence_end - silence_start
-                
-                silence_gaps.append({
-                    "silence_start_ms": silence_start,
-                    "silence_end_ms": silence_end,
-                    "silence_duration_ms": silence_duration
-                })
-            
-            if silence_gaps:
-                logger.debug(f"Detected {len(silence_gaps)} internal silence gaps in ayah")
-            
-        except Exception as e:
-            logger.warning(f"Error detecting silence gaps: {e}")
+        if silence_gaps:
+            logger.debug("Detected %d internal silence gaps in ayah", len(silence_gaps))
         
         return silence_gaps
     
@@ -145,7 +325,8 @@ class AudioSplitter:
         self,
         audio: AudioSegment,
         cutoff_point_ms: int,
-        search_window_ms: int = 10000
+        search_window_ms: int = 10000,
+        energy_csum: Optional[np.ndarray] = None
     ) -> Optional[int]:
         """
         Search for silence gaps near a cutoff point.
@@ -154,59 +335,139 @@ class AudioSplitter:
             audio: Full audio segment
             cutoff_point_ms: The cutoff point to search around
             search_window_ms: How many ms to search before and after (default 10s)
+            energy_csum: _energy_cumsum(audio); pass it when searching repeatedly
             
         Returns:
             Midpoint of closest silence gap, or None if no silence found
         """
-        from pydub.silence import detect_silence
+        if energy_csum is None:
+            energy_csum = _energy_cumsum(audio)
         
         # Define search region
         search_start = max(0, cutoff_point_ms - search_window_ms)
         search_end = min(len(audio), cutoff_point_ms + search_window_ms)
         
-        # Extract the search segment
-        search_segment = audio[search_start:search_end]
-        
-        logger.info(f"  Searching for silence around {cutoff_point_ms}ms (±{search_window_ms}ms)")
+        logger.info("  Searching for silence around %dms (±%dms)", cutoff_point_ms, search_window_ms)
         
-        # Detect silences in this segment
-        silences = detect_silence(
-            search_segment,
+        # Detect silences in the search region
+        silences = _detect_silence(
+            audio,
+            energy_csum,
+            search_start,
+            search_end,
             min_silence_len=500,  # 500ms minimum silence
             silence_thresh=-40    # -40 dBFS threshold
         )
         
         if not silences:
-            logger.warning(f"  No silence found in search window")
+            logger.warning("  No silence found in search window")
             return None
         
         # Find the silence closest to the cutoff point
-        # Silences are relative to search_segment, so adjust to absolute time
-        closest_silence = None
-        min_distance = float('inf')
-        
-        for silence_start, silence_end in silences:
-            # Convert to absolute time
-            abs_silence_start = search_start + silence_start
-            abs_silence_end = search_start + silence_end
-            silence_midpoint = (abs_silence_start + abs_silence_end) // 2
-            
-            # Calculate distance from cutoff point
-            distance = abs(silence_midpoint - cutoff_point_ms)
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_silence = silence_midpoint
+        # Silences are relative to search_start, so adjust to absolute time
+        # Ranges are sorted and disjoint, so their midpoints are sorted too: only
+        # the two midpoints around the cutoff can be closest (earlier one wins ties)
+        silence_ranges = np.asarray(silences, dtype=np.int64)
+        midpoints = search_start + (silence_ranges[:, 0] + silence_ranges[:, 1]) // 2
+        right = int(np.searchsorted(midpoints, cutoff_point_ms))
+        candidates = midpoints[max(0, right - 1):right + 1]
+        closest_silence = int(candidates[np.argmin(np.abs(candidates - cutoff_point_ms))])
         
-        if closest_silence:
-            logger.info(f"  ✓ Found silence at {closest_silence}ms (distance: {min_distance}ms from cutoff)")
+        logger.info(
+            "  ✓ Found silence at %dms (distance: %dms from cutoff)",
+            closest_silence, abs(closest_silence - cutoff_point_ms)
+        )
         
         return closest_silence
     
+    def _export_segment(
+        self,
+        audio: AudioSegment,
+        start_ms: int,
+        end_ms: int,
+        file_ext: str,
+        source_path: Optional[str] = None
+    ) -> bytes:
+        """
+        Encode an ayah segment in the output format.
+        
+        MP3 sources are cut straight from the original file with ffmpeg stream
+        copy when source_path is given; anything else (or a failed cut) is
+        sliced from the decoded audio and encoded with pydub, so the PCM copy
+        is only made when it is actually needed. WAV output is written
+        directly from the PCM slice.
+        
+        Args:
+            audio: Full audio segment
+            start_ms: Start of the ayah (ms)
+            end_ms: End of the ayah (ms)
+            file_ext: File extension of the original audio
+            source_path: Path to the original audio file (optional)
+            
+        Returns:
+            Encoded audio bytes
+        """
+        if source_path and file_ext in self.STREAM_COPY_FORMATS:
+            try:
+                return self._cut_with_ffmpeg(
+                    source_path, start_ms, end_ms, self.STREAM_COPY_FORMATS[file_ext]
+                )
+            except Exception as e:
+                logger.warning("ffmpeg stream copy failed (%s), re-encoding segment", e)
+        
+        export_format, export_options = self.EXPORT_FORMATS.get(file_ext, ('wav', {}))
+        if export_format == 'wav' and not export_options:
+            return _wav_bytes(audio[start_ms:end_ms])
+        
+        segment_buffer = io.BytesIO()
+        audio[start_ms:end_ms].export(segment_buffer, format=export_format, **export_options)
+        return segment_buffer.getvalue()
+    
+    def _zip_compression_for(self, filename: str) -> int:
+        """
+        Pick the zip compression for an ayah file.
+        
+        Args:
+            filename: Name of the file inside the zip
+            
+        Returns:
+            zipfile.ZIP_STORED for compressed audio, zipfile.ZIP_DEFLATED otherwise
+        """
+        if Path(filename).suffix in self.STORED_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+    
+    def _cut_with_ffmpeg(self, source_path: str, start_ms: int, end_ms: int, container: str) -> bytes:
+        """
+        Cut [start_ms, end_ms) out of the original file without re-encoding.
+        
+        Args:
+            source_path: Path to the original audio file
+            start_ms: Start of the cut (ms)
+            end_ms: End of the cut (ms)
+            container: ffmpeg output format
+            
+        Returns:
+            Audio bytes in the source codec
+        """
+        result = subprocess.run(
+            [
+                AudioSegment.converter, '-hide_banner', '-loglevel', 'error',
+                '-ss', f"{start_ms / 1000:.3f}", '-i', source_path,
+                '-t', f"{(end_ms - start_ms) / 1000:.3f}",
+                '-vn', '-c:a', 'copy', '-f', container, 'pipe:1'
+            ],
+            capture_output=True,
+            check=True
+        )
+        if not result.stdout:
+            raise RuntimeError("ffmpeg produced no output")
+        return result.stdout
+    
     def _extract_timestamps_from_verse_details(
         self,
         ayah_details: List[Dict]
-    ) -> List[Tuple[int, int, bool]]:
+    ) -> List[Tuple[int, int, int, int, bool]]:
         """
         Extract normalized timestamps from verse details.
         Timestamps are already adjusted and normalized by the pipeline.
@@ -215,31 +476,50 @@ class AudioSplitter:
             ayah_details: List of ayah details with normalized timestamps
             
         Returns:
-            List of (start_ms, end_ms, uncertain_flag) tuples
+            List of (start_ms, end_ms, original_start_ms, original_end_ms, uncertain_flag)
+            tuples; the originals are the timestamps before normalization
         """
-        timestamps = []
-        
-        for idx, detail in enumerate(ayah_details):
-            # Use normalized timestamps if available, otherwise fall back to original
-            if 'normalized_start_time' in detail and 'normalized_end_time' in detail:
-                # Timestamps are in seconds, convert to milliseconds
-                start_ms = int(detail['normalized_start_time'] * 1000)
-                end_ms = int(detail['normalized_end_time'] * 1000)
-            elif 'start_time' in detail and 'end_time' in detail:
-                # Fall back to original timestamps (also in seconds)
-                start_ms = int(detail['start_time'] * 1000)
-                end_ms = int(detail['end_time'] * 1000)
-            else:
-                # Legacy format with string timestamps
-                start_ms = self._parse_timestamp(detail.get('audio_start_timestamp', '00:00:00.000'))
-                end_ms = self._parse_timestamp(detail.get('audio_end_timestamp', '00:00:00.000'))
-            
-            # All timestamps from pipeline are already adjusted, so uncertain is always False
-            uncertain = False
-            
-            timestamps.append((start_ms, end_ms, uncertain))
-            
-            logger.debug(f"Ayah {idx+1}: Using normalized timestamps [{start_ms}-{end_ms}]ms")
+        # Original seconds per detail, NaN for legacy string timestamps
+        original_seconds = np.array([
+            (detail['start_time'], detail['end_time'])
+            if 'start_time' in detail and 'end_time' in detail
+            else (np.nan, np.nan)
+            for detail in ayah_details
+        ], dtype=np.float64).reshape(-1, 2)
+        
+        # Normalized seconds where available, otherwise the originals
+        normalized_seconds = np.array([
+            (detail['normalized_start_time'], detail['normalized_end_time'])
+            if 'normalized_start_time' in detail and 'normalized_end_time' in detail
+            else (np.nan, np.nan)
+            for detail in ayah_details
+        ], dtype=np.float64).reshape(-1, 2)
+        has_normalized = ~np.isnan(normalized_seconds[:, :1])
+        seconds = np.where(has_normalized, normalized_seconds, original_seconds)
+        
+        # astype truncates toward zero, matching int(seconds * 1000)
+        bounds_ms = np.zeros((len(ayah_details), 4), dtype=np.int64)
+        has_seconds = ~np.isnan(seconds[:, 0])
+        bounds_ms[has_seconds, :2] = (seconds[has_seconds] * 1000).astype(np.int64)
+        has_original = ~np.isnan(original_seconds[:, 0])
+        bounds_ms[has_original, 2:] = (original_seconds[has_original] * 1000).astype(np.int64)
+        
+        # Legacy format with string timestamps, parsed once per detail
+        for idx in np.flatnonzero(~has_original).tolist():
+            detail = ayah_details[idx]
+            bounds_ms[idx, 2:] = (
+                self._parse_timestamp(detail.get('audio_start_timestamp', '00:00:00.000')),
+                self._parse_timestamp(detail.get('audio_end_timestamp', '00:00:00.000'))
+            )
+            if not has_seconds[idx]:
+                bounds_ms[idx, :2] = bounds_ms[idx, 2:]
+        
+        # All timestamps from pipeline are already adjusted, so uncertain is always False
+        timestamps = [(*bounds, False) for bounds in bounds_ms.tolist()]
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx, (start_ms, end_ms, *_) in enumerate(timestamps):
+                logger.debug("Ayah %d: Using normalized timestamps [%d-%d]ms", idx + 1, start_ms, end_ms)
         
         return timestamps
     
@@ -247,100 +527,108 @@ class AudioSplitter:
         self,
         audio: AudioSegment,
         ayah_details: List[Dict],
-        timestamps_list: List[Tuple],
+        timestamps_list: List[Tuple[int, int, int, int, bool]],
         file_ext: str,
-        surah_num: int
-    ) -> Tuple[io.BytesIO, List[Dict]]:
+        surah_num: int,
+        include_silence_gaps: bool = True,
+        source_path: Optional[str] = None
+    ) -> Tuple[IO[bytes], List[Dict]]:
         """
         Helper method to create a zip file with given timestamps.
         
         Args:
             audio: Loaded audio segment
             ayah_details: List of ayah details
-            timestamps_list: List of (start_ms, end_ms, uncertain_flag) tuples
+            timestamps_list: (start_ms, end_ms, original_start_ms, original_end_ms, uncertain_flag)
+                tuples from _extract_timestamps_from_verse_details
             file_ext: File extension
             surah_num: Surah number
+            include_silence_gaps: Fill each ayah's silence_gaps metadata
+            source_path: Original audio file, for cutting without re-encoding
             
         Returns:
             Tuple of (zip_buffer, ayah_metadata)
         """
-        zip_buffer = io.BytesIO()
+        # Small zips stay in memory; long surahs spill to a temp file instead of RAM
+        zip_buffer = tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MAX_BYTES, mode='w+b')
         ayah_metadata = []
         
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        # Silences are detected once over the whole track (500ms, -40dBFS);
+        # each ayah then picks the gaps inside its own span
+        track_silences = []
+        if include_silence_gaps:
+            try:
+                track_silences = _detect_silence(
+                    audio, _energy_cumsum(audio), 0, len(audio),
+                    min_silence_len=500,
+                    silence_thresh=-40
+                )
+            except Exception as e:
+                logger.warning(f"Error detecting silence gaps: {e}")
+        silence_starts = [silence_start for silence_start, _ in track_silences]
+        
+        audio_duration_ms = len(audio)
+        frames_per_ms = audio.frame_rate / 1000.0
+        
+        # Formats without an exporter are written as WAV
+        output_ext = file_ext if file_ext in self.EXPORT_FORMATS else '.wav'
+        
+        # Ayah texts are used per ayah and again for the combined transcription
+        tashkeel_texts = [detail.get('ayah_text_tashkeel', '') for detail in ayah_details]
+        
+        pending_exports = []
+        
+        with ThreadPoolExecutor(max_workers=self.EXPORT_WORKERS) as executor, \
+                zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
             logger.info(f"Creating zip file with {len(ayah_details)} ayahs")
             
             for idx, detail in enumerate(ayah_details):
                 try:
-                    # Get timestamps (with uncertainty flag)
-                    timestamp_tuple = timestamps_list[idx]
-                    if len(timestamp_tuple) == 3:
-                        start_time, end_time, uncertain = timestamp_tuple
-                    else:
-                        start_time, end_time = timestamp_tuple
-                        uncertain = False
+                    # Normalized and original timestamps (with uncertainty flag)
+                    start_time, end_time, original_start, original_end, uncertain = timestamps_list[idx]
                     
                     # Skip segments with 0 duration (shouldn't happen after audio_splitting step processing)
                     if end_time - start_time <= 0:
-                        logger.warning(f"Skipping ayah {detail['ayah_number']} with 0ms duration")
+                        logger.warning("Skipping ayah %s with 0ms duration", detail['ayah_number'])
                         continue
                     
-                    # Extract segment
-                    segment = audio[start_time:end_time]
+                    # Segment length as pydub's audio[start_time:end_time] would report it,
+                    # without copying the samples (the export slices them only if needed)
+                    segment_frames = (
+                        int(min(end_time, audio_duration_ms) * frames_per_ms)
+                        - int(min(start_time, audio_duration_ms) * frames_per_ms)
+                    )
+                    segment_duration_ms = round(1000 * (segment_frames / audio.frame_rate))
                     
                     # Generate filename (single ayah only - multi-ayah chunks are now split)
                     surah = detail['surah_number']
                     ayah = detail['ayah_number']
                     is_basmala = detail.get('is_basmala', False)
-                    ayah_text = detail.get('ayah_text_tashkeel', '')
+                    ayah_text = tashkeel_texts[idx]
                     
                     if is_basmala:
-                        filename = f"surah_{surah:03d}_ayah_000_basmala{file_ext}"
+                        filename = f"surah_{surah:03d}_ayah_000_basmala{output_ext}"
                         ayah_number_for_metadata = 0
                     else:
-                        filename = f"surah_{surah:03d}_ayah_{ayah:03d}{file_ext}"
+                        filename = f"surah_{surah:03d}_ayah_{ayah:03d}{output_ext}"
                         ayah_number_for_metadata = ayah
                     
-                    logger.debug(f"Creating single ayah file: {filename}")
-                    
-                    # Export segment
-                    segment_buffer = io.BytesIO()
-                    if file_ext == '.mp3':
-                        segment.export(segment_buffer, format='mp3', bitrate='192k')
-                    elif file_ext == '.wav':
-                        segment.export(segment_buffer, format='wav')
-                    elif file_ext == '.m4a':
-                        segment.export(segment_buffer, format='ipod')
-                    elif file_ext == '.ogg':
-                        segment.export(segment_buffer, format='ogg')
-                    elif file_ext == '.flac':
-                        segment.export(segment_buffer, format='flac')
-                    else:
-                        segment.export(segment_buffer, format='wav')
-                        filename = filename.replace(file_ext, '.wav')
-                    
-                    zip_file.writestr(filename, segment_buffer.getvalue())
+                    logger.debug("Creating single ayah file: %s", filename)
                     
-                    # Normalize text (basic normalization)
-                    import re
-                    # Remove diacritics and normalize
-                    ayah_text_normalized = re.sub(r'[\u064B-\u065F\u0670\u0610-\u061A\u06D6-\u06ED]', '', ayah_text)
-                    ayah_text_normalized = ayah_text_normalized.replace('أ', 'ا').replace('إ', 'ا').replace('آ', 'ا')
-                    ayah_text_normalized = ayah_text_normalized.replace('ة', 'ه')
-                    ayah_text_normalized = ' '.join(ayah_text_normalized.split())
+                    # Export segment in the background (ffmpeg encodes run in
+                    # parallel); files are added to the zip in ayah order below
+                    export_future = executor.submit(
+                        self._export_segment, audio, start_time, end_time, file_ext, source_path
+                    )
                     
-                    # Calculate original timestamps (before normalization)
-                    if 'start_time' in detail and 'end_time' in detail:
-                        original_start = int(detail['start_time'] * 1000)
-                        original_end = int(detail['end_time'] * 1000)
-                    else:
-                        original_start = self._parse_timestamp(detail.get('audio_start_timestamp', '00:00:00.000'))
-                        original_end = self._parse_timestamp(detail.get('audio_end_timestamp', '00:00:00.000'))
+                    # Normalize text (basic normalization, cached per ayah text)
+                    ayah_text_normalized = _normalize_ayah_text(ayah_text)
+                    # Normalized text is single-space separated, so count separators
+                    normalized_word_count = ayah_text_normalized.count(' ') + 1 if ayah_text_normalized else 0
                     
                     # Detect silence gaps
-                    silence_gaps = self._detect_silence_gaps_in_segment(
-                        segment,
-                        threshold_ms=500
+                    silence_gaps = self._silence_in_range(
+                        track_silences, silence_starts, start_time, end_time
                     )
                     
                     # Calculate relative offsets
@@ -349,7 +637,7 @@ class AudioSplitter:
                     
                     # Log if ayah was cut off
                     if relative_actual_end < -1000:
-                        logger.warning(f"Ayah {detail['ayah_number']} cut off: {-relative_actual_end}ms removed")
+                        logger.warning("Ayah %s cut off: %dms removed", ayah, -relative_actual_end)
                     
                     # Build metadata matching API format
                     metadata_entry = {
@@ -357,24 +645,24 @@ class AudioSplitter:
                         "ayah_number": ayah_number_for_metadata,
                         "ayah_text_tashkeel": detail.get('text', ayah_text),
                         "ayah_text_normalized": detail.get('text_normalized', ayah_text_normalized),
-                        "ayah_word_count": detail.get('ayah_word_count', len(ayah_text_normalized.split())),
+                        "ayah_word_count": detail.get('ayah_word_count', normalized_word_count),
                         "start_from_word": detail.get('start_from_word', 1),
-                        "end_to_word": detail.get('end_to_word', len(ayah_text_normalized.split())),
-                        "audio_start_timestamp": self._format_timestamp(original_start),
-                        "audio_end_timestamp": self._format_timestamp(original_end),
+                        "end_to_word": detail.get('end_to_word', normalized_word_count),
+                        "audio_start_timestamp": _format_timestamp_ms(original_start),
+                        "audio_end_timestamp": _format_timestamp_ms(original_end),
                         "audio_start_offset_absolute_ms": original_start,
                         "audio_end_offset_absolute_ms": original_end,
                         "match_confidence": detail.get('match_confidence', 1.0),
                         "is_basmala": is_basmala,
                         "filename": filename,
-                        "duration_seconds": round(len(segment) / 1000, 2),
+                        "duration_seconds": round(segment_duration_ms / 1000, 2),
                         "chunk_mapping": detail.get('chunk_mapping', []),
                         # Legacy fields for backward compatibility
                         "audio_start_offset_absolute_ms_legacy": start_time,
                         "audio_end_offset_absolute_ms_legacy": end_time,
                         "actual_ayah_start_offset_relative_ms": relative_actual_start,
                         "actual_ayah_end_offset_relative_ms": relative_actual_end,
-                        "silence_gaps": silence_gaps if silence_gaps else [],
+                        "silence_gaps": silence_gaps,
                         "cutoff_uncertain": uncertain
                     }
                     
@@ -390,20 +678,31 @@ class AudioSplitter:
                         metadata_entry["word_count_aligned"] = len(word_alignments)
                     
                     ayah_metadata.append(metadata_entry)
+                    pending_exports.append((filename, export_future, metadata_entry))
                     
-                    uncertainty_note = " [UNCERTAIN CUTOFF]" if uncertain else ""
-                    logger.debug(f"Added {filename} (duration: {len(segment)/1000:.2f}s){uncertainty_note}")
+                    logger.debug(
+                        "Added %s (duration: %.2fs)%s",
+                        filename, segment_duration_ms / 1000, " [UNCERTAIN CUTOFF]" if uncertain else ""
+                    )
                     
                 except Exception as e:
-                    logger.error(f"Error processing ayah {idx+1}: {e}")
+                    logger.error("Error processing ayah %d: %s", idx + 1, e)
                     continue
             
+            for filename, export_future, metadata_entry in pending_exports:
+                try:
+                    zip_file.writestr(
+                        filename,
+                        export_future.result(),
+                        compress_type=self._zip_compression_for(filename)
+                    )
+                except Exception as e:
+                    logger.error("Error exporting %s: %s", filename, e)
+                    ayah_metadata.remove(metadata_entry)
+            
             # Add metadata JSON
             # Combine all ayah texts for transcription field
-            combined_transcription = " ".join([
-                detail.get('ayah_text_tashkeel', '') 
-                for detail in ayah_details
-            ])
+            combined_transcription = " ".join(tashkeel_texts)
             
             metadata_json = {
                 "surah_number": surah_num,
@@ -451,11 +750,46 @@ https://github.com/sayedmahmoud266/quran-ai-transcriping
         zip_buffer.seek(0)
         return zip_buffer, ayah_metadata
     
+    def _load_audio(self, audio_file_path: str, file_ext: str) -> AudioSegment:
+        """
+        Load the original audio file as a pydub AudioSegment.
+        
+        FLAC and OGG are decoded in-process with libsndfile (soundfile) instead
+        of piping through an ffmpeg subprocess; other formats, or files
+        libsndfile can't read, go through pydub.
+        
+        Args:
+            audio_file_path: Path to the original audio file
+            file_ext: Lowercase file extension
+            
+        Returns:
+            Loaded audio segment
+        """
+        if file_ext in self.SOUNDFILE_FORMATS:
+            try:
+                # Keep 24/32-bit and float sources at 32-bit instead of truncating to 16
+                subtype = sf.info(audio_file_path).subtype
+                dtype = 'int16' if subtype in ('PCM_S8', 'PCM_U8', 'PCM_16', 'VORBIS', 'OPUS') else 'int32'
+                samples, sample_rate = sf.read(audio_file_path, dtype=dtype, always_2d=True)
+                return AudioSegment(
+                    samples.tobytes(),
+                    frame_rate=sample_rate,
+                    sample_width=samples.dtype.itemsize,
+                    channels=samples.shape[1]
+                )
+            except Exception as e:
+                logger.info(f"soundfile failed, falling back to pydub: {e}")
+        
+        # Known extensions are passed as a format hint; anything else is probed
+        audio_format = file_ext.lstrip('.') if file_ext in self.EXPORT_FORMATS else None
+        return AudioSegment.from_file(audio_file_path, format=audio_format)
+    
     def split_audio_by_ayahs(
         self,
         audio_file_path: str,
-        ayah_details: List[Dict]
-    ) -> Tuple[io.BytesIO, str]:
+        ayah_details: List[Dict],
+        include_silence_gaps: bool = True
+    ) -> Tuple[IO[bytes], str]:
         """
         Split audio file into individual ayah segments and create a zip file.
         Uses intelligent gap detection for optimal ayah boundaries.
@@ -463,28 +797,17 @@ https://github.com/sayedmahmoud266/quran-ai-transcriping
         Args:
             audio_file_path: Path to the original audio file
             ayah_details: List of ayah details with timestamps
+            include_silence_gaps: Fill each ayah's silence_gaps metadata
             
         Returns:
-            Tuple of (BytesIO object containing zip file, suggested filename)
+            Tuple of (zip file object, suggested filename); large zips are spooled to disk
         """
         try:
             # Load the original audio file
             file_ext = Path(audio_file_path).suffix.lower()
             logger.info(f"Loading audio file: {audio_file_path} (format: {file_ext})")
             
-            # Load audio based on format
-            if file_ext == '.mp3':
-                audio = AudioSegment.from_mp3(audio_file_path)
-            elif file_ext == '.wav':
-                audio = AudioSegment.from_wav(audio_file_path)
-            elif file_ext == '.m4a':
-                audio = AudioSegment.from_file(audio_file_path, format='m4a')
-            elif file_ext == '.ogg':
-                audio = AudioSegment.from_ogg(audio_file_path)
-            elif file_ext == '.flac':
-                audio = AudioSegment.from_file(audio_file_path, format='flac')
-            else:
-                audio = AudioSegment.from_file(audio_file_path)
+            audio = self._load_audio(audio_file_path, file_ext)
             
             logger.info(f"Audio loaded: duration={len(audio)/1000:.2f}s, channels={audio.channels}, sample_rate={audio.frame_rate}Hz")
             
@@ -520,7 +843,8 @@ https://github.com/sayedmahmoud266/quran-ai-transcriping
             # Create zip file
             zip_buffer, _ = self._create_zip_with_timestamps(
                 audio, ayah_details, adjusted_timestamps,
-                file_ext, surah_num
+                file_ext, surah_num, include_silence_gaps,
+                source_path=audio_file_path
             )
             
             zip_filename = f"surah_{surah_num:03d}_ayahs.zip"
@@ -528,22 +852,21 @@ https://github.com/sayedmahmoud266/quran-ai-transcriping
             
             # Debug: Save after splitting
             if _debug_recorder:
+                # Convert the whole track to mono float32 once; ayahs are slices of it
+                # (zero-copy view of raw_data rather than an array.array copy)
+                track_samples = np.frombuffer(
+                    audio.raw_data, dtype=f'<i{audio.sample_width}'
+                ).reshape(-1, audio.channels)
+                track_mono = track_samples.mean(axis=1, dtype=np.float32)
+                track_mono *= np.float32(1.0 / audio.max_possible_amplitude)
+                frames_per_ms = audio.frame_rate / 1000.0
+                
                 # Extract ayah audio files for debug
-                import numpy as np
                 audio_files = []
                 for idx, detail in enumerate(ayah_details):
                     if idx < len(adjusted_timestamps):
-                        start_ms, end_ms, _ = adjusted_timestamps[idx]
-                        segment = audio[start_ms:end_ms]
-                        
-                        # Convert to numpy array
-                        samples = np.array(segment.get_array_of_samples())
-                        if segment.channels == 2:
-                            samples = samples.reshape((-1, 2))
-                            samples = samples.mean(axis=1)  # Convert to mono
-                        
-                        # Normalize to float32
-                        samples = samples.astype(np.float32) / 32768.0
+                        start_ms, end_ms = adjusted_timestamps[idx][:2]
+                        samples = track_mono[int(start_ms * frames_per_ms):int(end_ms * frames_per_ms)]
                         
                         ayah_num = detail.get('ayah_number', idx)
                         is_basmala = detail.get('is_basmala', False)
@@ -582,7 +905,11 @@ audio_splitter = AudioSplitter()
 
 
 # Convenience function for direct import
-def split_audio_by_ayahs(audio_file_path: str, ayah_details: List[Dict]) -> Tuple[io.BytesIO, str]:
+def split_audio_by_ayahs(
+    audio_file_path: str,
+    ayah_details: List[Dict],
+    include_silence_gaps: bool = True
+) -> Tuple[IO[bytes], str]:
     """
     Split audio file by ayah timestamps and create a ZIP file.
     
@@ -591,8 +918,9 @@ def split_audio_by_ayahs(audio_file_path: str, ayah_details: List[Dict]) -> Tupl
     Args:
         audio_file_path: Path to the audio file
         ayah_details: List of ayah details with timestamps
+        include_silence_gaps: Fill each ayah's silence_gaps metadata
         
     Returns:
         Tuple of (zip_buffer, zip_filename)
     """
-    return audio_splitter.split_audio_by_ayahs(audio_file_path, ayah_details)
+    return audio_splitter.split_audio_by_ayahs(audio_file_path, ayah_details, include_silence_gaps)
@@ -5,14 +5,76 @@ Debug utilities for saving processing pipeline data at each step.
 import os
 import json
 import logging
+import queue
+import threading
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import numpy as np
 import soundfile as sf
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _json_default(obj: Any) -> Any:
+    """Encode numpy arrays/scalars as JSON lists/numbers; anything else as str()."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def _encode_json(data: Any, pretty: bool = True) -> Optional[bytes]:
+    """
+    Encode data as UTF-8 JSON with orjson (indented when pretty).
+    
+    orjson produces the bytes in a single buffer (no intermediate str).
+    Returns None when orjson is not installed or can't encode the data
+    (e.g. ints beyond 64 bits). numpy types orjson doesn't handle natively
+    go through _json_default.
+    """
+    if orjson is None:
+        return None
+    
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, default=_json_default, option=option)
+    except TypeError:
+        return None
+
+
+def _dump_json(path: Path, data: Any, pretty: bool = True):
+    """
+    Write data as UTF-8 JSON with the stdlib encoder.
+    
+    json.dump streams its chunks through a 1 MiB write buffer, so the
+    document is never held in memory as a whole.
+    """
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        json.dump(data, f, ensure_ascii=False, indent=2 if pretty else None, default=_json_default)
+
+
+def _count_entries(path: str) -> int:
+    """Count files and directories below path (like len(list(Path(path).rglob('*'))))."""
+    count = 0
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+    return count
+
+
 class DebugRecorder:
     """Records processing pipeline data for debugging."""
     
@@ -28,6 +90,16 @@ class DebugRecorder:
         self.enabled = enabled
         self.base_dir = None
         self.step_counter = 0  # Track step index for folder naming
+        self._step_dirs: Dict[str, Path] = {}  # step_name -> indexed step directory
+        # Compact data.json unless DEBUG_PRETTY is set (indenting is slow and large)
+        self.pretty_json = os.environ.get('DEBUG_PRETTY', 'false').lower() in ('true', '1', 'yes')
+        # 'wav' (playable) or 'npy' (raw numpy dump, no encoding; read by debug_chunk_extractor)
+        self.audio_format = 'npy' if os.environ.get('DEBUG_AUDIO_FORMAT', 'wav').lower() == 'npy' else 'wav'
+        
+        # File writes run on a background thread so the pipeline doesn't wait
+        # on disk; the bounded queue keeps a slow disk from piling up audio
+        self._write_queue = None
+        self._writer_thread = None
         
         if self.enabled:
             # Create debug directory structure
@@ -36,6 +108,42 @@ class DebugRecorder:
             self.base_dir = debug_root / job_id
             self.base_dir.mkdir(parents=True, exist_ok=True)
             logger.info(f"Debug mode enabled for job {job_id} at {self.base_dir}")
+            
+            self._write_queue = queue.Queue(maxsize=64)
+            self._writer_thread = threading.Thread(
+                target=self._write_loop, name=f"debug-writer-{job_id}", daemon=True
+            )
+            self._writer_thread.start()
+    
+    def _write_loop(self):
+        """Run queued file writes until close() sends the stop marker."""
+        while True:
+            task = self._write_queue.get()
+            try:
+                if task is None:
+                    return
+                write, args = task
+                write(*args)
+            except Exception as e:
+                logger.error(f"Error writing debug file: {e}", exc_info=True)
+            finally:
+                self._write_queue.task_done()
+    
+    def _write_in_background(self, write, *args):
+        """Queue a file write (blocks while 64 writes are already pending)."""
+        self._write_queue.put((write, args))
+    
+    def flush(self):
+        """Wait until all queued debug files are written."""
+        if self._write_queue is not None:
+            self._write_queue.join()
+    
+    def close(self):
+        """Write any queued debug files and stop the writer thread."""
+        if self._writer_thread is not None:
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
     
     def save_step(
         self,
@@ -49,7 +157,7 @@ class DebugRecorder:
         
         Args:
             step_name: Name of the processing step
-            data: Dictionary of data to save as JSON
+            data: Dictionary of data to save as JSON (a "_timestamp" key is added)
             audio_files: List of audio file dictionaries with 'name' and 'audio' keys
             sample_rate: Audio sample rate
         """
@@ -62,21 +170,26 @@ class DebugRecorder:
             indexed_step_name = f"{self.step_counter:02d}_{step_name}"
             step_dir = self.base_dir / indexed_step_name
             step_dir.mkdir(parents=True, exist_ok=True)
+            self._step_dirs[step_name] = step_dir
             
             # Increment counter for next step
             self.step_counter += 1
             
-            # Save timestamp
-            timestamp_file = step_dir / "timestamp.txt"
-            with open(timestamp_file, 'w') as f:
-                f.write(datetime.now().isoformat())
+            # The step timestamp is saved in data.json (no separate file per step)
+            data = {'_timestamp': datetime.now().isoformat(), **(data or {})}
+            if audio_files and self.audio_format == 'npy':
+                # .npy files don't carry a sample rate
+                data['_audio_sample_rate'] = sample_rate
             
-            # Save JSON data
-            if data is not None:
-                json_file = step_dir / "data.json"
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2, default=str)
-                logger.debug(f"Saved {step_name} data to {json_file}")
+            # Save JSON data; it is encoded here, before later steps can
+            # change the objects it references, and written in the background
+            json_file = step_dir / "data.json"
+            payload = _encode_json(data, pretty=self.pretty_json)
+            if payload is not None:
+                self._write_in_background(json_file.write_bytes, payload)
+            else:
+                _dump_json(json_file, data, pretty=self.pretty_json)
+            logger.debug(f"Saved {step_name} data to {json_file}")
             
             # Save audio files
             if audio_files:
@@ -92,9 +205,14 @@ class DebugRecorder:
                         if not isinstance(audio, np.ndarray):
                             audio = np.array(audio)
                         
-                        # Save as WAV file
-                        audio_path = audio_dir / f"{name}.wav"
-                        sf.write(str(audio_path), audio, sample_rate)
+                        # Save as WAV or .npy (pipeline steps replace audio arrays
+                        # rather than writing into them, so no copy is needed)
+                        if self.audio_format == 'npy':
+                            audio_path = audio_dir / f"{name}.npy"
+                            self._write_in_background(np.save, str(audio_path), audio)
+                        else:
+                            audio_path = audio_dir / f"{name}.wav"
+                            self._write_in_background(sf.write, str(audio_path), audio, sample_rate)
                         logger.debug(f"Saved {indexed_step_name} audio: {audio_path}")
             
             logger.info(f"Debug: Saved step '{indexed_step_name}' to {step_dir}")
@@ -117,15 +235,19 @@ class DebugRecorder:
         try:
             # If step_name doesn't have index prefix, find the matching directory
             if not step_name[0:2].isdigit():
-                # Look for existing directory with this step name
-                matching_dirs = list(self.base_dir.glob(f"*_{step_name}"))
-                if matching_dirs:
-                    step_dir = matching_dirs[0]  # Use the first match
-                else:
-                    # Create new directory with current counter
-                    indexed_step_name = f"{self.step_counter:02d}_{step_name}"
-                    step_dir = self.base_dir / indexed_step_name
-                    self.step_counter += 1
+                # Directories created by this recorder are known without a glob
+                step_dir = self._step_dirs.get(step_name)
+                if step_dir is None:
+                    # Look for existing directory with this step name
+                    matching_dirs = list(self.base_dir.glob(f"*_{step_name}"))
+                    if matching_dirs:
+                        step_dir = matching_dirs[0]  # Use the first match
+                    else:
+                        # Create new directory with current counter
+                        indexed_step_name = f"{self.step_counter:02d}_{step_name}"
+                        step_dir = self.base_dir / indexed_step_name
+                        self.step_counter += 1
+                    self._step_dirs[step_name] = step_dir
             else:
                 # Already indexed
                 step_dir = self.base_dir / step_name
@@ -146,15 +268,19 @@ class DebugRecorder:
         if not self.enabled or not self.base_dir:
             return "Debug mode disabled"
         
+        self.flush()
+        
         summary = [f"Debug data for job {self.job_id}:"]
         summary.append(f"Location: {self.base_dir}")
         summary.append("\nSteps recorded:")
         
         if self.base_dir.exists():
-            for step_dir in sorted(self.base_dir.iterdir()):
-                if step_dir.is_dir():
-                    files = list(step_dir.rglob('*'))
-                    summary.append(f"  - {step_dir.name}: {len(files)} files")
+            with os.scandir(self.base_dir) as entries:
+                step_dirs = sorted(
+                    (entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name
+                )
+            for step_dir in step_dirs:
+                summary.append(f"  - {step_dir.name}: {_count_entries(step_dir.path)} files")
         
         return "\n".join(summary)
 
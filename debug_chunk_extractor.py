@@ -13,11 +13,62 @@ Example:
 """
 
 import json
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import numpy as np
 import soundfile as sf
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _SourceReaders:
+    """
+    One open SoundFile per worker thread for the step's source audio.
+    
+    SoundFile handles aren't thread-safe, so each pool thread opens the
+    source once and seeks within it for every chunk it writes.
+    """
+    
+    def __init__(self, audio_file: Path):
+        self.audio_file = audio_file
+        self._local = threading.local()
+        self._handles = []
+        self._lock = threading.Lock()
+    
+    def get(self) -> sf.SoundFile:
+        source = getattr(self._local, 'source', None)
+        if source is None:
+            source = sf.SoundFile(str(self.audio_file))
+            self._local.source = source
+            with self._lock:
+                self._handles.append(source)
+        return source
+    
+    def close(self):
+        for source in self._handles:
+            source.close()
+        self._handles.clear()
+
+
+def _write_chunk(readers: _SourceReaders, dtype: str, start_sample: int, end_sample: int,
+                 chunk_filename: Path, sample_rate: int):
+    """
+    Read one chunk's frames from the source audio and save them as a WAV file.
+    
+    Only the frames of the chunk are ever in memory.
+    """
+    source = readers.get()
+    start_sample = min(start_sample, source.frames)
+    source.seek(start_sample)
+    chunk_audio = source.read(max(0, min(end_sample, source.frames) - start_sample), dtype=dtype)
+    sf.write(str(chunk_filename), chunk_audio, sample_rate)
+
 
 def extract_chunks(step_folder: str):
     """
@@ -42,8 +93,11 @@ def extract_chunks(step_folder: str):
         print(f"❌ Error: data.json not found in {step_path}")
         return
     
-    with open(data_file, 'r') as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(data_file.read_bytes())
+    else:
+        with open(data_file, 'r') as f:
+            data = json.load(f)
     
     print(f"✅ Loaded data.json")
     
@@ -53,8 +107,8 @@ def extract_chunks(step_folder: str):
         print(f"❌ Error: audio folder not found in {step_path}")
         return
     
-    # Find audio file (usually audio.wav)
-    audio_files = list(audio_folder.glob("*.wav"))
+    # Find audio file (usually audio.wav, or audio.npy with DEBUG_AUDIO_FORMAT=npy)
+    audio_files = list(audio_folder.glob("*.wav")) or list(audio_folder.glob("*.npy"))
     if not audio_files:
         print(f"❌ Error: No audio files found in {audio_folder}")
         return
@@ -62,9 +116,22 @@ def extract_chunks(step_folder: str):
     audio_file = audio_files[0]
     print(f"✅ Found audio file: {audio_file.name}")
     
-    # Load audio
-    audio_array, sample_rate = sf.read(str(audio_file))
-    print(f"✅ Loaded audio: {sample_rate}Hz, {len(audio_array)} samples, {len(audio_array)/sample_rate:.2f}s")
+    if audio_file.suffix == '.npy':
+        # Memory-mapped; chunks are slices of it, paged in as they are written
+        audio_array = np.load(str(audio_file), mmap_mode='r')
+        dtype = None
+        num_frames = len(audio_array)
+        sample_rate = data.get('_audio_sample_rate', 16000)
+    else:
+        # Only the header is read here; each chunk's frames are read when it
+        # is written. 16-bit debug WAVs stay int16 so chunks are written back
+        # without a float round trip
+        audio_array = None
+        audio_info = sf.info(str(audio_file))
+        dtype = 'int16' if audio_info.subtype == 'PCM_16' else 'float64'
+        num_frames = audio_info.frames
+        sample_rate = audio_info.samplerate
+    print(f"✅ Opened audio: {sample_rate}Hz, {num_frames} samples, {num_frames/sample_rate:.2f}s")
     
     # Get sample rate from data if available
     if 'sample_rate' in data:
@@ -98,30 +165,45 @@ def extract_chunks(step_folder: str):
     
     # Extract and save each chunk
     print(f"\n🔪 Extracting chunks...")
-    for i, chunk in enumerate(chunks):
-        # Get chunk boundaries (handle different key names)
-        start = chunk.get('start', chunk.get('start_time', 0))
-        end = chunk.get('end', chunk.get('end_time', 0))
-        
-        # Convert time to samples
-        start_sample = int(start * sample_rate)
-        end_sample = int(end * sample_rate)
-        
-        # Validate boundaries
-        if start_sample < 0:
-            start_sample = 0
-        if end_sample > len(audio_array):
-            end_sample = len(audio_array)
-        
-        # Extract chunk
-        chunk_audio = audio_array[start_sample:end_sample]
-        
-        # Save chunk
-        chunk_filename = chunks_output / f"chunk_{i:03d}_{start:.2f}s-{end:.2f}s.wav"
-        sf.write(str(chunk_filename), chunk_audio, sample_rate)
-        
-        duration = end - start
-        print(f"   ✓ Chunk {i:3d}: {start:7.2f}s - {end:7.2f}s ({duration:6.2f}s) → {chunk_filename.name}")
+    # Get chunk boundaries (handle different key names)
+    chunk_starts = [chunk.get('start', chunk.get('start_time', 0)) for chunk in chunks]
+    chunk_ends = [chunk.get('end', chunk.get('end_time', 0)) for chunk in chunks]
+    
+    # Convert times to samples for all chunks at once (astype truncates like int())
+    start_samples = (np.asarray(chunk_starts, dtype=np.float64) * sample_rate).astype(np.int64)
+    end_samples = (np.asarray(chunk_ends, dtype=np.float64) * sample_rate).astype(np.int64)
+    
+    # Validate boundaries
+    start_samples = np.maximum(start_samples, 0).tolist()
+    end_samples = np.minimum(end_samples, num_frames).tolist()
+    
+    # soundfile releases the GIL while libsndfile writes, so chunk files
+    # are written in parallel; progress is still printed in chunk order
+    readers = _SourceReaders(audio_file)
+    try:
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+            pending_writes = []
+            for i, (start, end, start_sample, end_sample) in enumerate(
+                zip(chunk_starts, chunk_ends, start_samples, end_samples)
+            ):
+                # Extract and save chunk
+                chunk_filename = chunks_output / f"chunk_{i:03d}_{start:.2f}s-{end:.2f}s.wav"
+                if audio_array is not None:
+                    write_future = executor.submit(
+                        sf.write, str(chunk_filename), audio_array[start_sample:end_sample], sample_rate
+                    )
+                else:
+                    write_future = executor.submit(
+                        _write_chunk, readers, dtype, start_sample, end_sample, chunk_filename, sample_rate
+                    )
+                pending_writes.append((i, start, end, chunk_filename, write_future))
+            
+            for i, start, end, chunk_filename, write_future in pending_writes:
+                write_future.result()
+                duration = end - start
+                print(f"   ✓ Chunk {i:3d}: {start:7.2f}s - {end:7.2f}s ({duration:6.2f}s) → {chunk_filename.name}")
+    finally:
+        readers.close()
     
     print(f"\n✅ Done! Extracted {len(chunks)} chunks to {chunks_output}")
     
@@ -133,7 +215,7 @@ def extract_chunks(step_folder: str):
         f.write(f"Step: {step_path.name}\n")
         f.write(f"Audio: {audio_file.name}\n")
         f.write(f"Sample Rate: {sample_rate}Hz\n")
-        f.write(f"Total Audio Duration: {len(audio_array)/sample_rate:.2f}s\n")
+        f.write(f"Total Audio Duration: {num_frames/sample_rate:.2f}s\n")
         f.write(f"Number of Chunks: {len(chunks)}\n\n")
         f.write(f"Chunks:\n")
         f.write(f"-" * 60 + "\n")
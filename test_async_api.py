@@ -2,28 +2,75 @@
 Test script for async API endpoints.
 """
 
+import json
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import sys
 
 BASE_URL = "http://localhost:8000"
 
-def test_health():
+def create_session():
+    """Create a session that reuses connections across requests (and status polls)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def test_health(session):
     """Test health endpoint."""
     print("Testing /health endpoint...")
-    response = requests.get(f"{BASE_URL}/health")
+    response = session.get(f"{BASE_URL}/health")
     print(f"Status: {response.status_code}")
     print(f"Response: {response.json()}")
     print()
 
-def test_async_workflow(audio_file_path):
+def wait_for_job(session, job_id, timeout=300):
+    """
+    Wait until a job is completed or failed and return its last status.
+    
+    Follows the /jobs/{job_id}/events stream; servers without it (404)
+    are polled every 5 seconds instead.
+    """
+    deadline = time.monotonic() + timeout
+    status_data = {'status': None}
+    
+    # Keep-alive comments arrive every 15s, so a 30s read timeout only trips on a dead stream
+    with session.get(f"{BASE_URL}/jobs/{job_id}/events", stream=True, timeout=(5, 30)) as response:
+        if response.status_code != 404:
+            for line in response.iter_lines(decode_unicode=True):
+                if line and line.startswith('data:'):
+                    status_data = json.loads(line[len('data:'):])
+                    print(f"  Status: {status_data['status']}")
+                    if status_data['status'] in ('completed', 'failed'):
+                        break
+                if time.monotonic() > deadline:
+                    break
+            return status_data
+    
+    attempt = 0
+    while time.monotonic() < deadline:
+        time.sleep(5)
+        attempt += 1
+        
+        response = session.get(f"{BASE_URL}/jobs/{job_id}/status")
+        status_data = response.json()
+        print(f"  Attempt {attempt}: {status_data['status']}")
+        
+        if status_data['status'] in ('completed', 'failed'):
+            break
+    
+    return status_data
+
+def test_async_workflow(session, audio_file_path):
     """Test complete async workflow."""
     print(f"Testing async workflow with {audio_file_path}...")
     
     # 1. Submit job
     print("\n1. Submitting job...")
     with open(audio_file_path, 'rb') as f:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/transcribe/async",
             files={'audio_file': f}
         )
@@ -38,37 +85,25 @@ def test_async_workflow(audio_file_path):
     print(f"✓ Job submitted: {job_id}")
     print(f"  Status: {data['status']}")
     
-    # 2. Poll for completion
-    print("\n2. Polling for completion...")
-    max_attempts = 60  # 5 minutes max
-    attempt = 0
+    # 2. Wait for completion
+    print("\n2. Waiting for completion...")
+    status_data = wait_for_job(session, job_id)
+    status = status_data['status']
     
-    while attempt < max_attempts:
-        time.sleep(5)
-        attempt += 1
-        
-        response = requests.get(f"{BASE_URL}/jobs/{job_id}/status")
-        status_data = response.json()
-        status = status_data['status']
-        
-        print(f"  Attempt {attempt}: {status}")
-        
-        if status == 'completed':
-            print(f"✓ Job completed!")
-            print(f"  Started at: {status_data['started_at']}")
-            print(f"  Completed at: {status_data['completed_at']}")
-            break
-        elif status == 'failed':
-            print(f"✗ Job failed: {status_data.get('error', 'Unknown error')}")
-            return
-    
-    if status != 'completed':
+    if status == 'completed':
+        print(f"✓ Job completed!")
+        print(f"  Started at: {status_data['started_at']}")
+        print(f"  Completed at: {status_data['completed_at']}")
+    elif status == 'failed':
+        print(f"✗ Job failed: {status_data.get('error', 'Unknown error')}")
+        return
+    else:
         print("✗ Timeout waiting for job completion")
         return
     
     # 3. Get metadata
     print("\n3. Getting metadata...")
-    response = requests.get(f"{BASE_URL}/jobs/{job_id}/metadata")
+    response = session.get(f"{BASE_URL}/jobs/{job_id}/metadata")
     metadata = response.json()
     print(f"✓ Metadata retrieved:")
     print(f"  Surah: {metadata.get('surah_number')}")
@@ -77,23 +112,25 @@ def test_async_workflow(audio_file_path):
     
     # 4. Download result
     print("\n4. Downloading result...")
-    response = requests.get(f"{BASE_URL}/jobs/{job_id}/download")
-    
-    if response.status_code == 200:
-        output_file = f"test_result_{job_id[:8]}.zip"
-        with open(output_file, 'wb') as f:
-            f.write(response.content)
-        print(f"✓ Result downloaded: {output_file}")
-        print(f"  Size: {len(response.content)} bytes")
-    else:
-        print(f"✗ Download failed: {response.status_code}")
+    # Streamed to disk in 1 MiB pieces so the zip is never held in memory
+    with session.get(f"{BASE_URL}/jobs/{job_id}/download", stream=True) as response:
+        if response.status_code == 200:
+            output_file = f"test_result_{job_id[:8]}.zip"
+            with open(output_file, 'wb') as f:
+                for block in response.iter_content(chunk_size=1 << 20):
+                    f.write(block)
+                size = f.tell()
+            print(f"✓ Result downloaded: {output_file}")
+            print(f"  Size: {size} bytes")
+        else:
+            print(f"✗ Download failed: {response.status_code}")
     
     print("\n✓ Async workflow test completed successfully!")
 
-def test_list_jobs():
+def test_list_jobs(session):
     """Test list jobs endpoint."""
     print("\nTesting /jobs endpoint...")
-    response = requests.get(f"{BASE_URL}/jobs?limit=10")
+    response = session.get(f"{BASE_URL}/jobs?limit=10")
     data = response.json()
     print(f"✓ Found {data['total']} jobs")
     for job in data['jobs'][:3]:
@@ -106,10 +143,11 @@ if __name__ == "__main__":
         print("  python test_async_api.py --health")
         sys.exit(1)
     
-    if sys.argv[1] == "--health":
-        test_health()
-    else:
-        audio_file = sys.argv[1]
-        test_health()
-        test_async_workflow(audio_file)
-        test_list_jobs()
+    with create_session() as session:
+        if sys.argv[1] == "--health":
+            test_health(session)
+        else:
+            audio_file = sys.argv[1]
+            test_health(session)
+            test_async_workflow(session, audio_file)
+            test_list_jobs(session)